@@ -0,0 +1,48 @@
+"""Webhook endpoint for PhantomBuster completion callbacks."""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException, Request
+from loguru import logger
+
+from backend.services.scrapping.plugins.linkedin import LinkedInPlugin
+
+router = APIRouter()
+
+
+@router.post("/phantombuster/callback")
+async def phantombuster_callback(request: Request) -> Dict[str, Any]:
+    """Resolve a pending phantom launch from a PhantomBuster completion push.
+
+    The payload carries the finished container's id and the URL of its
+    result JSON; the waiting launch coroutine is woken immediately instead
+    of discovering the result on its next poll.
+
+    The endpoint is publicly reachable, so the caller must present the
+    shared webhook token (header or query parameter) when one is
+    configured, and the result URL is validated against PhantomBuster's
+    hosts before it is fetched.
+    """
+    token = request.headers.get("X-Webhook-Token") or request.query_params.get("token")
+    if not LinkedInPlugin.verify_webhook_token(token):
+        logger.warning("PhantomBuster callback rejected: bad or missing webhook token")
+        raise HTTPException(status_code=403, detail="Invalid webhook token")
+
+    try:
+        payload = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+    container_id = payload.get("containerId") or payload.get("container_id")
+    json_url = payload.get("resultUrl") or payload.get("resultObjectUrl")
+
+    if not container_id or not json_url:
+        logger.warning("PhantomBuster callback missing containerId or result URL")
+        return {"handled": False}
+
+    handled = LinkedInPlugin.resolve_container(str(container_id), str(json_url))
+    if not handled:
+        logger.info(f"No pending launch for container '{container_id}' (stale callback?)")
+    return {"handled": handled}
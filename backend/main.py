@@ -6,6 +6,7 @@ from backend.api import (
     client_interne_data_routes,
     client_search_routes,
     debug_routes,
+    phantombuster_routes,
 )
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -39,6 +40,7 @@ app.include_router(cache_routes.router, prefix="/api", tags=["Cache Management"]
 app.include_router(client_search_routes.router, prefix="/api", tags=["Client Search"])
 app.include_router(client_interne_data_routes.router, prefix="/api", tags=["Client Internal Data"])
 app.include_router(client_externe_data_routes.router, prefix="/api", tags=["Client External Data"])
+app.include_router(phantombuster_routes.router, prefix="/api", tags=["PhantomBuster"])
 
 # Include debug routes only in DEBUG_MODE
 if DEBUG_MODE:
@@ -6,13 +6,29 @@ from dataikuapi import DSSClient
 
 logger = logging.getLogger(__name__)
 
+# Rows per write batch: large enough to amortize the HTTP round-trip, small
+# enough to cap peak memory on the ingest side.
+DEFAULT_BATCH_SIZE = 5000
+
+# Authenticated DSSClient per (url, api_key): repeated connect() calls in
+# scheduled runs reuse the session instead of redoing the TLS handshake.
+_CLIENT_CACHE: dict = {}
+
 
 class DataikuClient:
-    def __init__(self, dss_url: str, api_key: str, project_key: str, dataset_name: str):
+    def __init__(
+        self,
+        dss_url: str,
+        api_key: str,
+        project_key: str,
+        dataset_name: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
         self.dss_url = dss_url
         self.api_key = api_key
         self.project_key = project_key
         self.dataset_name = dataset_name
+        self.batch_size = batch_size
         self._client: Optional[DSSClient] = None
         self._project = None
 
@@ -20,7 +36,11 @@ class DataikuClient:
         if not all([self.dss_url, self.api_key, self.project_key, self.dataset_name]):
             raise ValueError("Missing Dataiku configuration")
         logger.info("Connecting to Dataiku...")
-        self._client = DSSClient(self.dss_url, self.api_key)
+        cache_key = (self.dss_url, self.api_key)
+        client = _CLIENT_CACHE.get(cache_key)
+        if client is None:
+            client = _CLIENT_CACHE.setdefault(cache_key, DSSClient(self.dss_url, self.api_key))
+        self._client = client
         self._project = self._client.get_project(self.project_key)
         logger.info("Connected to Dataiku project %s", self.project_key)
 
@@ -32,5 +52,16 @@ class DataikuClient:
             return
         dataset = self._project.get_dataset(self.dataset_name)
         core_dataset = dataset.get_as_core_dataset()
-        core_dataset.write_with_schema(dataframe)
+
+        if len(dataframe) <= self.batch_size:
+            core_dataset.write_with_schema(dataframe)
+        else:
+            # Stream in batches through one writer: peak memory stays at one
+            # chunk and the server ingests while the next chunk is prepared,
+            # instead of blocking on a single HTTP body for the whole frame.
+            core_dataset.write_schema_from_dataframe(dataframe)
+            with core_dataset.get_writer() as writer:
+                for start in range(0, len(dataframe), self.batch_size):
+                    writer.write_dataframe(dataframe.iloc[start : start + self.batch_size])
+
         logger.info("Wrote %d rows to Dataiku dataset %s", len(dataframe), self.dataset_name)
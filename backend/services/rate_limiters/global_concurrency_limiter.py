@@ -22,7 +22,6 @@ Usage Example:
 """
 
 import asyncio
-import time
 import os
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
@@ -73,6 +72,10 @@ class GlobalConcurrencyLimiter:
         # Job tracking for logging and metrics
         self._active_jobs: Dict[str, float] = {}
 
+        # Public admission counter: logging and stats must not peek at the
+        # private (and racy) asyncio.Semaphore._value attribute.
+        self._in_flight: int = 0
+
         logger.info(
             f"GlobalConcurrencyLimiter initialized: "
             f"max_concurrent_jobs={config.max_concurrent_jobs}, "
@@ -89,22 +92,28 @@ class GlobalConcurrencyLimiter:
         - Record job start time
         - Release automatically on exit
         """
-        start_time = time.time()
+        # Monotonic clock: immune to NTP jumps and cheaper than time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         await self._semaphore.acquire()  # Block until a slot is free
+        self._in_flight += 1
 
         try:
-            # Log entry
-            logger.debug(
-                f"Job '{job_name}' started. "
-                f"Active jobs: {self._semaphore._value}/{self.config.max_concurrent_jobs}"
+            # Log entry (lazy: the message is only built when a sink accepts DEBUG)
+            logger.opt(lazy=True).debug(
+                "Job '{}' started. Active jobs: {}/{}",
+                lambda: job_name,
+                lambda: self._in_flight,
+                lambda: self.config.max_concurrent_jobs,
             )
 
             # Optional: enforce delay between consecutive jobs
             async with self._lock:
                 if self.config.min_delay_between_jobs > 0:
-                    logger.debug(
-                        f"Applying {self.config.min_delay_between_jobs:.1f}s delay "
-                        f"before starting '{job_name}'"
+                    logger.opt(lazy=True).debug(
+                        "Applying {:.1f}s delay before starting '{}'",
+                        lambda: self.config.min_delay_between_jobs,
+                        lambda: job_name,
                     )
                     await asyncio.sleep(self.config.min_delay_between_jobs)
 
@@ -117,11 +126,15 @@ class GlobalConcurrencyLimiter:
         finally:
             # Job done → release resources
             self._active_jobs.pop(job_name, None)
+            self._in_flight -= 1
             self._semaphore.release()
-            duration = time.time() - start_time
-            logger.debug(
-                f"Job '{job_name}' finished after {duration:.1f}s. "
-                f"Remaining slots: {self._semaphore._value}/{self.config.max_concurrent_jobs}"
+            duration = loop.time() - start_time
+            logger.opt(lazy=True).debug(
+                "Job '{}' finished after {:.1f}s. Remaining slots: {}/{}",
+                lambda: job_name,
+                lambda: duration,
+                lambda: self.config.max_concurrent_jobs - self._in_flight,
+                lambda: self.config.max_concurrent_jobs,
             )
 
     def get_stats(self) -> Dict[str, Optional[int]]:
@@ -129,7 +142,7 @@ class GlobalConcurrencyLimiter:
         return {
             "max_concurrent_jobs": self.config.max_concurrent_jobs,
             "current_active_jobs": len(self._active_jobs),
-            "available_slots": self._semaphore._value,
+            "available_slots": self.config.max_concurrent_jobs - self._in_flight,
         }
 
     def reset(self) -> None:
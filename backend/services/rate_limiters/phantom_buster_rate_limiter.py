@@ -3,12 +3,20 @@
 import asyncio
 import random
 import time
+from bisect import bisect_right
 from contextlib import asynccontextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, Optional
 
+import numpy as np
 from loguru import logger
 
+# Size of the pre-sampled jitter ring buffer (power of two so we can mask the index)
+_JITTER_BUFFER_SIZE = 1024
+# Random delay bounds (seconds) used to mimic human behavior between calls
+_JITTER_MIN_DELAY = 10.0
+_JITTER_MAX_DELAY = 30.0
+
 # ============================================================================
 # Data classes for Rate Limiter config and History of Phantom buster API calls
 # ============================================================================
@@ -25,12 +33,18 @@ class RateLimitConfig:
     enable_random_delay: bool = True
 
 
-@dataclass
 class CallRecord:
-    """Record of API calls for rate limiting tracking."""
+    """Record of API calls for rate limiting tracking.
+
+    Slotted (no per-instance __dict__): many records stay alive at once and
+    their fields are touched on every rate-limit check.
+    """
+
+    __slots__ = ("last_call_time", "timestamps")
 
-    timestamps: list[float] = field(default_factory=list)
-    last_call_time: Optional[float] = None
+    def __init__(self) -> None:
+        self.timestamps: list[float] = []
+        self.last_call_time: Optional[float] = None
 
 
 # ============================================================================
@@ -56,6 +70,18 @@ class RateLimiter:
         self._semaphore = asyncio.Semaphore(config.max_concurrent_calls)  # Limit concurrent calls
         self._lock = asyncio.Lock()  # Prevent race conditions when updating records
 
+        # Pre-sampled random delays: avoids hitting the shared `random` module state
+        # on every call, and gives each limiter instance its own uncorrelated stream.
+        self._jitter = (
+            np.random.default_rng()
+            .uniform(_JITTER_MIN_DELAY, _JITTER_MAX_DELAY, size=_JITTER_BUFFER_SIZE)
+            .astype(np.float32)
+        )
+        self._jitter_i = 0
+        # Strong reference to the in-flight refill task: a bare create_task
+        # result may be garbage-collected mid-flight.
+        self._refill_task: Optional[asyncio.Task] = None
+
         logger.info(
             f"Rate limiter initialized: {config.max_calls_per_hour} calls/hour, "
             f"{config.max_calls_per_day} calls/day, "
@@ -75,7 +101,7 @@ class RateLimiter:
         """
         # Step 1: Acquire a semaphore ticket
         await self._semaphore.acquire()
-        logger.debug(f"🔒 Semaphore acquired for {phantom_id}")
+        logger.opt(lazy=True).debug("🔒 Semaphore acquired for {}", lambda: phantom_id)
 
         try:
             # Step 2: Wait if the rate limit (per hour/day) has been reached.
@@ -86,8 +112,10 @@ class RateLimiter:
 
             # Step 4: Add random 10-30s delay to mimic human behavior and avoid bot detection
             if self.config.enable_random_delay:
-                random_delay = random.uniform(10, 30)  # nosec B311
-                logger.debug(f"⏱️ Adding random delay of {random_delay:.1f}s")
+                random_delay = self._next_jitter()
+                logger.opt(lazy=True).debug(
+                    "⏱️ Adding random delay of {:.1f}s", lambda: random_delay
+                )
                 await asyncio.sleep(random_delay)
 
             # Step 5: Yield control back to the calling code.
@@ -95,61 +123,101 @@ class RateLimiter:
 
         finally:
             self._semaphore.release()
-            logger.debug(f"🔓 Semaphore released for {phantom_id}")
+            logger.opt(lazy=True).debug("🔓 Semaphore released for {}", lambda: phantom_id)
+
+    def _next_jitter(self) -> float:
+        """Return the next pre-sampled random delay and refill the buffer when it wraps."""
+        delay = float(self._jitter[self._jitter_i & (_JITTER_BUFFER_SIZE - 1)])
+        self._jitter_i += 1
+
+        # Resample off the hot path once a full buffer has been consumed
+        if self._jitter_i & (_JITTER_BUFFER_SIZE - 1) == 0:
+            self._refill_task = asyncio.create_task(self._refill_jitter())
+            self._refill_task.add_done_callback(self._clear_refill_task)
+
+        return delay
+
+    async def _refill_jitter(self) -> None:
+        """Resample the jitter ring buffer in a background task."""
+        self._jitter = (
+            np.random.default_rng()
+            .uniform(_JITTER_MIN_DELAY, _JITTER_MAX_DELAY, size=_JITTER_BUFFER_SIZE)
+            .astype(np.float32)
+        )
+
+    def _clear_refill_task(self, _task: asyncio.Task) -> None:
+        """Drop the reference to a finished refill task."""
+        self._refill_task = None
 
     async def _wait_for_rate_limit(self, phantom_id: str) -> None:
-        """Wait until rate limits allow a new call."""
-        # Async lock to prevent multiple courotines from modifying self._records at the same time.
-        async with self._lock:
-            record = self._records.get(phantom_id, CallRecord())
-            current_time = time.time()
-
-            # Clean old timestamps (keep only last 24h)
-            one_hour_ago = current_time - 3600
-            one_day_ago = current_time - 86400
-            record.timestamps = [ts for ts in record.timestamps if ts > one_day_ago]
-
-            # Check hourly limit
-            recent_calls = [ts for ts in record.timestamps if ts > one_hour_ago]
-            if len(recent_calls) >= self.config.max_calls_per_hour:
-                wait_time = 3600 - (current_time - recent_calls[0]) + 1
-                logger.warning(
-                    f"⏳ Hourly limit reached for {phantom_id} "
-                    f"({len(recent_calls)}/{self.config.max_calls_per_hour}). "
-                    f"Waiting {wait_time:.0f}s..."
-                )
-                await asyncio.sleep(wait_time)
-                # Recursive call to re-check after waiting
-                return await self._wait_for_rate_limit(phantom_id)
-
-            # Check daily limit
-            if len(record.timestamps) >= self.config.max_calls_per_day:
-                wait_time = 86400 - (current_time - record.timestamps[0]) + 1
-                logger.warning(
-                    f"⏳ Daily limit reached for {phantom_id} "
-                    f"({len(record.timestamps)}/{self.config.max_calls_per_day}). "
-                    f"Waiting {wait_time / 3600:.1f}h..."
+        """Wait until rate limits allow a new call.
+
+        Leaky-bucket style: the required wait is computed under the lock but
+        slept OUTSIDE it, so waiting on one phantom never stalls the others.
+        A small upward jitter desynchronizes coroutines blocked on the same
+        window so they do not all retry at the same instant.
+        """
+        while True:
+            async with self._lock:
+                wait_time = self._required_wait(phantom_id)
+                if wait_time <= 0:
+                    return
+
+            await asyncio.sleep(wait_time * (1.0 + 0.1 * random.random()))  # nosec B311
+
+    def _required_wait(self, phantom_id: str) -> float:
+        """Return how long the caller must wait before a call is allowed (0 if clear).
+
+        Must be called while holding self._lock.
+        """
+        # setdefault stores the record on first use instead of allocating a
+        # throwaway CallRecord on every call for unknown phantoms.
+        record = self._records.setdefault(phantom_id, CallRecord())
+        # Monotonic clock: immune to NTP jumps that would break timestamp ordering
+        current_time = asyncio.get_running_loop().time()
+
+        # Clean old timestamps (keep only last 24h)
+        one_hour_ago = current_time - 3600
+        one_day_ago = current_time - 86400
+        record.timestamps = [ts for ts in record.timestamps if ts > one_day_ago]
+
+        # Check hourly limit
+        recent_calls = [ts for ts in record.timestamps if ts > one_hour_ago]
+        if len(recent_calls) >= self.config.max_calls_per_hour:
+            wait_time = 3600 - (current_time - recent_calls[0]) + 1
+            logger.warning(
+                f"⏳ Hourly limit reached for {phantom_id} "
+                f"({len(recent_calls)}/{self.config.max_calls_per_hour}). "
+                f"Waiting {wait_time:.0f}s..."
+            )
+            return wait_time
+
+        # Check daily limit
+        if len(record.timestamps) >= self.config.max_calls_per_day:
+            wait_time = 86400 - (current_time - record.timestamps[0]) + 1
+            logger.warning(
+                f"⏳ Daily limit reached for {phantom_id} "
+                f"({len(record.timestamps)}/{self.config.max_calls_per_day}). "
+                f"Waiting {wait_time / 3600:.1f}h..."
+            )
+            return wait_time
+
+        # Check minimum delay between calls
+        if record.last_call_time:
+            elapsed = current_time - record.last_call_time
+            if elapsed < self.config.min_delay_between_calls:
+                wait_time = self.config.min_delay_between_calls - elapsed
+                logger.info(
+                    f"⏱️ Enforcing minimum delay for {phantom_id}. Waiting {wait_time:.0f}s..."
                 )
-                await asyncio.sleep(wait_time)
-                return await self._wait_for_rate_limit(phantom_id)
-
-            # Check minimum delay between calls
-            if record.last_call_time:
-                elapsed = current_time - record.last_call_time
-                if elapsed < self.config.min_delay_between_calls:
-                    wait_time = self.config.min_delay_between_calls - elapsed
-                    logger.info(
-                        f"⏱️ Enforcing minimum delay for {phantom_id}. Waiting {wait_time:.0f}s..."
-                    )
-                    await asyncio.sleep(wait_time)
-                    return None
-                return None
-            return None
+                return wait_time
+
+        return 0.0
 
     async def _record_call(self, phantom_id: str) -> None:
         """Record that a call was made."""
         async with self._lock:
-            current_time = time.time()
+            current_time = asyncio.get_running_loop().time()
 
             if phantom_id not in self._records:
                 self._records[phantom_id] = CallRecord()
@@ -158,9 +226,11 @@ class RateLimiter:
             record.timestamps.append(current_time)
             record.last_call_time = current_time
 
-            logger.debug(
-                f"✓ Call recorded for {phantom_id}. "
-                f"Total calls in last 24h: {len(record.timestamps)}"
+            # Lazy formatting: the message is only built when a sink accepts DEBUG
+            logger.opt(lazy=True).debug(
+                "✓ Call recorded for {}. Total calls in last 24h: {}",
+                lambda: phantom_id,
+                lambda: len(record.timestamps),
             )
 
     def get_stats(self, phantom_id: str) -> Dict[str, int]:
@@ -173,7 +243,9 @@ class RateLimiter:
         if not record:
             return {"hour": 0, "day": 0, "total": 0}
 
-        current_time = time.time()
+        # May be called outside a running loop, so fall back to time.monotonic()
+        # (same clock as loop.time() on the default event loop).
+        current_time = time.monotonic()
         one_hour_ago = current_time - 3600
         one_day_ago = current_time - 86400
 
@@ -195,14 +267,19 @@ class RateLimiter:
         total_day = 0
         total_all = 0
 
-        current_time = time.time()
+        current_time = time.monotonic()
         one_hour_ago = current_time - 3600
         one_day_ago = current_time - 86400
 
         for record in self._records.values():
-            total_hour += len([ts for ts in record.timestamps if ts > one_hour_ago])
-            total_day += len([ts for ts in record.timestamps if ts > one_day_ago])
-            total_all += len(record.timestamps)
+            # Timestamps are appended in increasing (monotonic) order, so the
+            # window counts come from a binary search instead of three full
+            # passes building throwaway lists.
+            timestamps = record.timestamps
+            count = len(timestamps)
+            total_hour += count - bisect_right(timestamps, one_hour_ago)
+            total_day += count - bisect_right(timestamps, one_day_ago)
+            total_all += count
 
         return {
             "total_calls_last_hour": total_hour,
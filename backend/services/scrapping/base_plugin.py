@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from config.config import SourceConfig
 
@@ -14,7 +14,13 @@ from config.config import SourceConfig
 
 
 class Event(BaseModel):
-    """Base model output."""
+    """Base model output.
+
+    Events are immutable once built. Plugins that emit many events from
+    already-cleaned data can skip validation with `Event.model_construct`.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     source: str  # "linkedin", "rss" ...  etc.
     source_type: str  # "company news", "sectorial news", "cybersecurity news"
@@ -55,3 +61,20 @@ class BasePlugin(ABC, Generic[ConfigType]):
     async def fetch(self, arguments: Dict[str, Any]) -> List[Event]:
         """Retrieve raw data from the source."""
         pass
+
+    async def fetch_stream(self, arguments: Dict[str, Any]) -> AsyncIterator[Event]:
+        """Yield events as they become available.
+
+        Default adapter over fetch() for plugins that build full lists.
+        Streaming plugins override this so downstream consumers can start
+        processing before every source has completed, with O(1) peak memory
+        per consumer tick instead of O(total events).
+        """
+        for event in await self.fetch(arguments):
+            yield event
+
+    async def close(self) -> None:
+        """Release resources held by the plugin (HTTP sessions, etc.).
+
+        Default is a no-op; plugins that keep long-lived connections override it.
+        """
@@ -1,10 +1,12 @@
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import dataiku
 import numpy as np
-from dataikuapi.dss.llm import DSSLLM
 from loguru import logger
 
+if TYPE_CHECKING:  # Imported lazily at runtime: dataiku clients are heavy to import
+    from dataikuapi.dss.llm import DSSLLM
+
 
 class DataikuEmbeddingEngine:
     """Embedding utilities backed by Dataiku's LLM service.
@@ -16,18 +18,25 @@ class DataikuEmbeddingEngine:
     Attributes:
         model_id (str): Dataiku LLM identifier for the embedding endpoint.
         model (DSSLLM): Dataiku DSS LLM client bound to `model_id`.
+        normalize_embeddings (bool): Flag indicating whether to L2-normalize embeddings.
     """
 
     def __init__(
-        self, model_id: str = "openai:artefact-llm-proxy:vertex_ai/text-multilingual-embedding-002"
+        self,
+        model_id: str = "openai:artefact-llm-proxy:vertex_ai/text-multilingual-embedding-002",
+        normalize_embeddings: bool = True,
     ) -> None:
         self.model_id = model_id
         self.model = DataikuEmbeddingEngine._load_model(self.model_id)
 
+        # Return unit vectors so downstream cosine similarity is a plain dot product,
+        # matching the behavior of EmbeddingEngine.
+        self.normalize_embeddings = normalize_embeddings
+
         logger.info(f"Embedding initialized with model: {self.model_id}")
 
     @staticmethod
-    def _load_model(model_id: str) -> DSSLLM:
+    def _load_model(model_id: str) -> "DSSLLM":
         """Resolve a Dataiku LLM embedding client by identifier.
 
         Args:
@@ -37,6 +46,9 @@ class DataikuEmbeddingEngine:
         Returns:
             DSSLLM: A handle to the configured embedding endpoint ready for inference.
         """
+        # Deferred import: keeps module import cheap for callers that never embed.
+        import dataiku
+
         client = dataiku.api_client()
         project = client.get_default_project()
 
@@ -49,7 +61,8 @@ class DataikuEmbeddingEngine:
             text (str): Input text to embed.
 
         Returns:
-            numpy.ndarray: 1D embedding vector returned by the Dataiku LLM endpoint.
+            numpy.ndarray: 1D embedding vector returned by the Dataiku LLM endpoint,
+            L2-normalized when `normalize_embeddings` is enabled.
 
         Raises:
             ValueError: If `text` is empty or only whitespace.
@@ -63,7 +76,13 @@ class DataikuEmbeddingEngine:
         embedding = emb_resp.get_embeddings()[0]
 
         # Cast to a NumPy array to ensure a consistent, typed vector output.
-        return np.asarray(embedding, dtype=np.float32)
+        embedding = np.asarray(embedding, dtype=np.float32)
+
+        if self.normalize_embeddings:
+            # Single vectorized pass; the clip guards against a zero-norm vector.
+            embedding /= np.linalg.norm(embedding, axis=-1, keepdims=True).clip(min=1e-12)
+
+        return embedding
 
 
 # Cache the engine so repeated calls reuse the same Dataiku client handle.
@@ -72,16 +91,18 @@ class DataikuEmbeddingEngine:
 @lru_cache(maxsize=1)
 def get_embedding(
     model_id: str = "openai:artefact-llm-proxy:vertex_ai/text-multilingual-embedding-002",
+    normalize_embeddings: bool = True,
 ) -> DataikuEmbeddingEngine:
     """Return a cached DataikuEmbeddingEngine instance.
 
     Args:
         model_id (str): Dataiku LLM identifier of the embedding endpoint.
+        normalize_embeddings (bool): Flag indicating whether to normalize embeddings.
 
     Returns:
         DataikuEmbeddingEngine: Singleton-like instance cached via LRU.
     """
-    return DataikuEmbeddingEngine(model_id)
+    return DataikuEmbeddingEngine(model_id, normalize_embeddings)
 
 
 def get_embedding_instance() -> DataikuEmbeddingEngine:
@@ -1,12 +1,11 @@
 from functools import lru_cache
+from typing import TYPE_CHECKING, List
 
 import numpy as np
-from dotenv import load_dotenv
 from loguru import logger
-from sentence_transformers import SentenceTransformer
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:  # Imported lazily at runtime: sentence_transformers pulls in torch
+    from sentence_transformers import SentenceTransformer
 
 
 class EmbeddingEngine:
@@ -23,6 +22,11 @@ class EmbeddingEngine:
         model_name: str = "all-MiniLM-L6-v2",
         normalize_embeddings: bool = True,
     ) -> None:
+        # Load environment variables only when an engine is actually created.
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
         # Persist configuration to allow multiple engines with different settings.
         self.model_name = model_name
         self.model = EmbeddingEngine._load_model(model_name)
@@ -33,7 +37,7 @@ class EmbeddingEngine:
         logger.info(f"Embedding initialized with model: {model_name}")
 
     @staticmethod
-    def _load_model(model_name: str) -> SentenceTransformer:
+    def _load_model(model_name: str) -> "SentenceTransformer":
         """Load a SentenceTransformer model by name.
 
         Args:
@@ -42,6 +46,9 @@ class EmbeddingEngine:
         Returns:
             SentenceTransformer: Loaded model ready for inference.
         """
+        # Deferred import: keeps module import cheap for callers that never embed.
+        from sentence_transformers import SentenceTransformer
+
         return SentenceTransformer(model_name)
 
     def text_to_embedding(self, text: str) -> np.ndarray:
@@ -66,6 +73,38 @@ class EmbeddingEngine:
         # Ensure a consistent numpy array output regardless of backend settings.
         return np.asarray(embedding, dtype=np.float32)
 
+    def texts_to_embeddings(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """Generate embedding vectors for several texts in one batched call.
+
+        A single batched forward pass amortizes tokenization and model launch
+        overhead compared to calling :meth:`text_to_embedding` in a loop.
+
+        Args:
+            texts (List[str]): Input texts to encode.
+            batch_size (int): Sub-batch size used by the model to bound memory.
+
+        Returns:
+            numpy.ndarray: 2D array of shape (len(texts), embedding_dim).
+
+        Raises:
+            ValueError: If any provided text is empty or only whitespace.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        if any(not text or not text.strip() for text in texts):
+            raise ValueError("texts_to_embeddings received an empty text input.")
+
+        embeddings = self.model.encode(
+            list(texts),
+            batch_size=batch_size,
+            normalize_embeddings=self.normalize_embeddings,
+            show_progress_bar=False,
+        )
+
+        # Ensure a consistent numpy array output regardless of backend settings.
+        return np.asarray(embeddings, dtype=np.float32)
+
 
 # Cache the engine so repeated calls reuse the same heavy model instance.
 
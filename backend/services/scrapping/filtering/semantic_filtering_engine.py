@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 from loguru import logger
-from sklearn.metrics.pairwise import cosine_similarity
 
 from backend.services.scrapping.base_plugin import Event
 from backend.services.scrapping.embedding.embedding_engine import (
@@ -43,9 +43,20 @@ class SemanticFilteringEngine:
         # Initialize the embedding engine used to generate embeddings.
         self.embedding_engine = get_embedding_instance()
 
-        # Store provided configuration.
-        self.keywords_list = keywords_list
+        # Store provided configuration. Keywords are frozen into a tuple and the
+        # threshold is mirrored as a numpy scalar so hot-path comparisons against
+        # numpy scores avoid Python float boxing.
+        self.keywords_list = tuple(keywords_list)
         self.threshold = threshold
+        self._threshold_np = np.float32(threshold)
+
+        # Per-instance cache so is_article_relevant and get_filter_explanation
+        # share one forward pass when invoked on the same article text.
+        self._embed_cached = lru_cache(maxsize=4096)(self._embed_normalized)
+
+        # Aggregated decision counters, reported once per batch via flush_stats()
+        # instead of logging one line per article in the hot path.
+        self._stats: Dict[str, float] = {"kept": 0, "dropped": 0, "sum_score": 0.0}
 
         # Pre-compute embeddings for the reference keywords to avoid recomputation.
         logger.info(
@@ -68,16 +79,23 @@ class SemanticFilteringEngine:
           embeddings for the reference keywords, or `None` if an error occurs.
         """
         try:
-            # Compute an embedding for each keyword and stack them into an array.
-            embeddings: List[np.ndarray] = []
-            for keyword in self.keywords_list:
-                embedding = self.embedding_engine.text_to_embedding(keyword)
-                embeddings.append(embedding)
-
-            if not embeddings:
+            if not self.keywords_list:
                 return np.empty((0, 0))
 
-            return np.array(embeddings)
+            # Embed all keywords in one batched forward pass instead of one
+            # model call per keyword. The batched call already returns a single
+            # contiguous (N, D) array, so no per-row list stacking or extra
+            # full-size copy happens here (asarray is a no-op for float32 input).
+            embeddings = self.embedding_engine.texts_to_embeddings(list(self.keywords_list))
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+
+            # Pre-normalize rows once so cosine similarity against a normalized
+            # article vector reduces to a single matrix-vector product.
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
+
+            # Store as float16: the similarity is memory-bandwidth-bound and the
+            # precision loss is negligible for thresholding unit vectors.
+            return embeddings.astype(np.float16)
         except Exception as exc:
             logger.error("Error pre-computing keyword embeddings: {}", exc)
             return None
@@ -102,9 +120,13 @@ class SemanticFilteringEngine:
             # Prepare the article text by combining title and body.
             article_text = self._prepare_article_text(article)
 
-            # Convert article text to an embedding vector and ensure 2D shape.
-            article_embedding = self.embedding_engine.text_to_embedding(article_text)
-            article_embedding = np.array([article_embedding])  # Shape: (1, embedding_dim)
+            # Degenerate input: skip the model call entirely and fail safe.
+            if not article_text:
+                logger.debug("Empty article text; defaulting to keep article '{}'", safe_title)
+                return True
+
+            # Convert article text to a normalized embedding vector (cached).
+            article_embedding = self._embed_cached(article_text)
 
             # Guard against missing or empty keyword embeddings.
             if self.keywords_embeddings is None or self.keywords_embeddings.size == 0:
@@ -114,14 +136,15 @@ class SemanticFilteringEngine:
                 )
                 return True
 
-            # Compute cosine similarities and obtain the maximum score.
-            cosine_scores = cosine_similarity(article_embedding, self.keywords_embeddings)
+            # Keyword rows are pre-normalized, so cosine similarity is one gemv.
+            cosine_scores = self.keywords_embeddings @ article_embedding
             max_score = float(cosine_scores.max())
 
             # Compare to threshold to make a relevance decision.
             is_relevant = max_score >= self.threshold
 
-            logger.info(
+            self._record_decision(is_relevant, max_score)
+            logger.debug(
                 "Article '{}' | similarity={:.3f} | relevant={}",
                 safe_title,
                 max_score,
@@ -138,6 +161,65 @@ class SemanticFilteringEngine:
             # Fail-safe: consider article relevant if an error occurs.
             return True
 
+    def is_articles_relevant(self, articles: List[Event]) -> List[bool]:
+        """Check relevance for a batch of articles in one embedding pass.
+
+        Embeds all article texts with a single batched model call and computes
+        every similarity with one (N, D) x (D, K) matrix product, instead of
+        one forward pass and one gemv per article.
+
+        Args:
+          articles: Events produced by scraping plugins.
+
+        Returns:
+          One boolean per article, in input order. Articles with empty text and
+          any batch-level failure default to True as a fail-safe, mirroring
+          `is_article_relevant`.
+        """
+        if not articles:
+            return []
+
+        # Fail-safe default: keep everything unless proven irrelevant.
+        results = [True] * len(articles)
+
+        try:
+            texts = [self._prepare_article_text(article) for article in articles]
+
+            # Guard against missing or empty keyword embeddings.
+            if self.keywords_embeddings is None or self.keywords_embeddings.size == 0:
+                logger.warning(
+                    "No keyword embeddings available; defaulting to keep {} article(s)",
+                    len(articles),
+                )
+                return results
+
+            # Empty texts cannot be embedded; they keep the fail-safe default.
+            indexed_texts = [(i, text) for i, text in enumerate(texts) if text]
+            if not indexed_texts:
+                return results
+
+            # One batched forward pass over all non-empty article texts.
+            embeddings = self.embedding_engine.texts_to_embeddings(
+                [text for _, text in indexed_texts]
+            )
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
+
+            # One GEMM for the full batch, then a vectorized threshold compare.
+            scores = embeddings.astype(np.float16) @ self.keywords_embeddings.T
+            max_scores = scores.max(axis=1)
+            relevant = max_scores >= self._threshold_np
+
+            for (i, _), keep, score in zip(indexed_texts, relevant.tolist(), max_scores.tolist()):
+                results[i] = keep
+                self._record_decision(keep, score)
+
+            return results
+
+        except Exception as exc:
+            logger.error("Error in batched semantic filtering: {}", exc)
+            return results
+
     def get_filter_explanation(self, article: Event) -> Dict[str, Any]:
         """Provide details that explain the relevance decision.
 
@@ -151,10 +233,23 @@ class SemanticFilteringEngine:
         """
         safe_title = (article.title or "").strip()
         try:
-            # Prepare the text and embed it.
+            # Prepare the text and embed it (cached: shares the forward pass
+            # with a prior is_article_relevant call on the same article).
             article_text = self._prepare_article_text(article)
-            article_embedding = self.embedding_engine.text_to_embedding(article_text)
-            article_embedding = np.array([article_embedding])
+
+            # Degenerate input: skip the model call entirely and fail safe.
+            if not article_text:
+                return {
+                    "article_title": safe_title,
+                    "max_similarity_score": 0.0,
+                    "matched_reference_keyword": None,
+                    "threshold": self.threshold,
+                    "is_relevant": True,
+                    "decision": "KEEP",
+                    "note": "Empty article text.",
+                }
+
+            article_embedding = self._embed_cached(article_text)
 
             # Guard against missing or empty keyword embeddings.
             if self.keywords_embeddings is None or self.keywords_embeddings.size == 0:
@@ -168,13 +263,13 @@ class SemanticFilteringEngine:
                     "note": "No keyword embeddings available.",
                 }
 
-            # Compute cosine similarity vector and flatten to 1D.
-            cosine_scores = cosine_similarity(article_embedding, self.keywords_embeddings)
-            cosine_scores = cosine_scores.flatten()
+            # Keyword rows are pre-normalized, so cosine similarity is one gemv.
+            cosine_scores = self.keywords_embeddings @ article_embedding
 
-            # Identify best matching keyword and its score.
-            max_score = float(cosine_scores.max())
+            # Identify best matching keyword and its score in a single pass:
+            # argmax locates the winner, then one index read gives its score.
             max_idx = int(cosine_scores.argmax())
+            max_score = float(cosine_scores[max_idx])
             matched_keyword = self.keywords_list[max_idx]
 
             # Threshold decision.
@@ -205,6 +300,20 @@ class SemanticFilteringEngine:
                 "error": str(exc),
             }
 
+    def _embed_normalized(self, text: str) -> np.ndarray:
+        """Embed a text and L2-normalize the resulting vector.
+
+        Args:
+          text: Input text to embed.
+
+        Returns:
+          A 1D unit-norm float16 embedding vector, matching the dtype of the
+          pre-computed keyword matrix.
+        """
+        embedding = np.asarray(self.embedding_engine.text_to_embedding(text), dtype=np.float32)
+        embedding /= np.linalg.norm(embedding) + 1e-12
+        return embedding.astype(np.float16)
+
     def _prepare_article_text(self, article: Event) -> str:
         """Combine article title and text into a single string.
 
@@ -226,6 +335,27 @@ class SemanticFilteringEngine:
             return text
         return ""
 
+    def _record_decision(self, is_relevant: bool, score: float) -> None:
+        """Accumulate per-article decision counters for summary logging."""
+        self._stats["kept" if is_relevant else "dropped"] += 1
+        self._stats["sum_score"] += score
+
+    def flush_stats(self) -> None:
+        """Log a summary of filtering decisions since the last flush, then reset.
+
+        Intended to be called once at the end of a plugin run so the hot
+        filtering path only pays for counter updates, not per-article log I/O.
+        """
+        total = int(self._stats["kept"] + self._stats["dropped"])
+        if total:
+            logger.info(
+                "Semantic filter summary | kept={} | dropped={} | avg_similarity={:.3f}",
+                int(self._stats["kept"]),
+                int(self._stats["dropped"]),
+                self._stats["sum_score"] / total,
+            )
+        self._stats = {"kept": 0, "dropped": 0, "sum_score": 0.0}
+
     def update_threshold(self, threshold: float) -> None:
         """Update the relevance threshold.
 
@@ -234,6 +364,7 @@ class SemanticFilteringEngine:
         """
         # Replace the threshold used for future relevance decisions.
         self.threshold = threshold
+        self._threshold_np = np.float32(threshold)
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Return performance and configuration information.
@@ -30,8 +30,6 @@ class PluginManager:
     @classmethod
     def get_plugin(cls, plugin_type: str) -> type[BasePlugin]:
         """Return a plugin."""
-        if cls._plugins is None:
-            cls._plugins = {}
         return cls._plugins.get(plugin_type)
 
     @classmethod
@@ -46,7 +44,7 @@ class PluginManager:
         """Create a plugin instance from its configuration."""
         # Checks if enabled
         if not source_config.enabled:
-            logger.info(f"Plugin '{source_config.name}' disabled")
+            logger.info("Plugin '{}' disabled", source_config.name)
             return None
 
         # Retrieves the class
@@ -79,13 +77,16 @@ class PluginManager:
         """
         plugins = []
 
-        for config in source_configs:
+        # Pre-filter so the creation loop only visits enabled configurations.
+        enabled_configs = [config for config in source_configs if config.enabled]
+
+        for config in enabled_configs:
             try:
                 plugin = cls.create_plugin(config)
                 if plugin:  # None if disabled
                     plugins.append(plugin)
-                    logger.info(f"Plugin '{config.name}' created")
+                    logger.info("Plugin '{}' created", config.name)
             except Exception as e:
-                logger.error(f"Error with '{config.name}': {e}")
+                logger.error("Error with '{}': {}", config.name, e)
 
         return plugins
@@ -1,7 +1,11 @@
 import asyncio
+import hmac
+import json
+import random
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 import aiohttp
 from loguru import logger
@@ -12,6 +16,41 @@ from backend.services.scrapping.base_plugin import BasePlugin, Event
 from backend.services.scrapping.plugin_manager import PluginManager
 from config.config import SourceConfig
 
+# Result-polling backoff: total budget and per-wait cap (seconds)
+_POLL_DEADLINE = 300.0
+_POLL_MAX_DELAY = 15.0
+
+# How long to wait for a webhook push before falling back to polling (seconds)
+_WEBHOOK_WAIT = 600.0
+
+# Completed-result cache TTLs (seconds): URL resolution is stable for days,
+# profiles and posts change more often. Every hit saves a full phantom launch.
+_URL_CACHE_TTL = 7 * 86400.0
+_PROFILE_CACHE_TTL = 86400.0
+_POSTS_CACHE_TTL = 86400.0
+_CACHE_MAX_ENTRIES = 256
+
+# Precompiled once: the result URL is matched on every poll iteration. Only
+# the tail of the agent log needs scanning — the link is appended at the end.
+_RESULT_JSON_RE = re.compile(r"https://\S+result\.json")
+_RESULT_LOG_TAIL = 2048
+
+# URL-finder coalescing: lookups submitted within this window share one
+# phantom launch (the url_finder agent accepts multiple input lines).
+_URL_BATCH_WINDOW = 0.05
+_URL_BATCH_MAX = 25
+
+
+def _parse_ts(s: Optional[str]) -> Optional[datetime]:
+    """Parse a PhantomBuster post timestamp (ISO 8601, 'Z' suffix allowed)."""
+    if not s:
+        return None
+    try:
+        return datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+    except (ValueError, TypeError):
+        logger.warning(f"Could not parse post timestamp: {s}")
+        return None
+
 # ============================================================================
 # Linkedin Plugin Configuration Schema (with Pydantic)
 # ============================================================================
@@ -46,6 +85,13 @@ class LinkedInPluginConfig(BaseModel):
     session_cookie: str = Field(..., min_length=1)
     user_agent: Optional[str] = Field(None)
     number_max_of_posts: int = Field(3)
+    # Public URL of this service's /phantombuster/callback endpoint; when set,
+    # launches register it so results are pushed instead of polled.
+    webhook_url: Optional[str] = Field(None)
+    # Shared secret appended to the registered webhook URL and required back
+    # on every callback: the endpoint is otherwise open to anyone able to
+    # guess a containerId.
+    webhook_secret: Optional[str] = Field(None)
     phantoms: PhantomConfig
     rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
 
@@ -78,10 +124,131 @@ class LinkedInPluginError(RuntimeError):
     """Raised when the LinkedIn plugin fails to complete an external call."""
 
 
+# Hosts PhantomBuster serves result JSON from. Callback-supplied result URLs
+# are checked against this list before being fetched, so a forged callback
+# cannot point the download at an arbitrary (e.g. internal) address.
+_RESULT_URL_HOSTS = ("phantombuster.s3.amazonaws.com",)
+_RESULT_URL_HOST_SUFFIXES = (".phantombuster.com", ".phantombooster.com")
+
+
+def _is_trusted_result_url(json_url: str) -> bool:
+    """Return True when `json_url` points at a known PhantomBuster result host."""
+    try:
+        parsed = urlparse(json_url)
+    except ValueError:
+        return False
+    host = parsed.hostname or ""
+    return parsed.scheme == "https" and (
+        host in _RESULT_URL_HOSTS or host.endswith(_RESULT_URL_HOST_SUFFIXES)
+    )
+
+
+class _UrlFinderBatcher:
+    """Coalesce concurrent URL lookups into a single phantom launch.
+
+    DataLoader-style: lookups submitted within a short window are flushed
+    together as one multi-line url_finder launch, collapsing N launches and
+    N rate-limiter slots into 1. Each caller awaits its own future, resolved
+    from the result row matching its input line.
+    """
+
+    def __init__(self, plugin: "LinkedInPlugin") -> None:
+        self._plugin = plugin
+        self._queue: List[Tuple[str, str, "asyncio.Future"]] = []
+        self._flush_task: Optional["asyncio.Task"] = None
+        # Strong references to in-flight batch tasks: a bare create_task
+        # result may be garbage-collected mid-flight.
+        self._batch_tasks: set = set()
+
+    async def submit(self, company_name: str, city: str) -> Optional[str]:
+        """Queue a lookup and await its share of the batched launch."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._queue.append((company_name, city, future))
+
+        if len(self._queue) >= _URL_BATCH_MAX:
+            # Full batch: flush immediately instead of waiting out the window.
+            self._flush_now()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    def _flush_now(self) -> None:
+        batch, self._queue = self._queue, []
+        task = asyncio.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(_URL_BATCH_WINDOW)
+        # Detach the launch instead of awaiting it: this task must complete
+        # once the window closes, so submits arriving while the (slow) launch
+        # is still running arm a fresh window instead of queueing unflushed.
+        if self._queue:
+            self._flush_now()
+
+    async def _run_batch(self, batch: List[Tuple[str, str, "asyncio.Future"]]) -> None:
+        try:
+            urls = await self._plugin._launch_url_finder_batch(
+                [(name, city) for name, city, _ in batch]
+            )
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+                    # Mark handled in case the caller was cancelled meanwhile.
+                    future.exception()
+            return
+
+        for (_, _, future), url in zip(batch, urls):
+            if not future.done():
+                future.set_result(url)
+
+
 @PluginManager.register("linkedin")
 class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
     """Plugin to extract company data from LinkedIn via PhantomBuster."""
 
+    # Launches waiting for a webhook push, keyed by containerId. Class-level
+    # so the callback route can resolve them without holding plugin instances.
+    _pending_containers: ClassVar[Dict[str, "asyncio.Future"]] = {}
+
+    # Shared secret the callback route checks tokens against; populated from
+    # config by whichever instance registers a webhook.
+    _webhook_secret: ClassVar[Optional[str]] = None
+
+    @classmethod
+    def verify_webhook_token(cls, token: Optional[str]) -> bool:
+        """Check a callback token against the configured webhook secret.
+
+        Returns True when no secret is configured (no webhook registered with
+        one), otherwise requires a constant-time match.
+        """
+        secret = cls._webhook_secret
+        if secret is None:
+            return True
+        return token is not None and hmac.compare_digest(token, secret)
+
+    @classmethod
+    def resolve_container(cls, container_id: str, json_url: str) -> bool:
+        """Resolve a launch waiting on `container_id` with its result-JSON URL.
+
+        Called by the webhook route when PhantomBuster pushes a completion
+        notification. Returns False for stale or unknown containers, and for
+        result URLs outside PhantomBuster's hosts — the URL is fetched and
+        ingested as phantom output, so it is never taken on faith from an
+        externally reachable endpoint.
+        """
+        if not _is_trusted_result_url(json_url):
+            logger.warning(f"Rejected untrusted result URL in callback: {json_url}")
+            return False
+        future = cls._pending_containers.get(container_id)
+        if future is None or future.done():
+            return False
+        future.set_result(json_url)
+        return True
+
     def _validate_config(self, config_dict: Dict[str, Any]) -> LinkedInPluginConfig:
         """Validate LinkedIn-specific configuration."""
         return LinkedInPluginConfig.model_validate(config_dict)
@@ -109,6 +276,24 @@ class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
         )
         self.rate_limiter = RateLimiter(rate_limit_config)
 
+        # Shared HTTP session injected by the pipeline for the current run;
+        # when absent, a lazily-created long-lived session (closed via close())
+        # is reused across phantom launches instead of one session per request.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._owned_session: Optional[aiohttp.ClientSession] = None
+
+        # PhantomBuster quota protection: concurrent duplicate lookups share one
+        # in-flight call, completed results are served from a TTL cache.
+        self._inflight: Dict[Tuple[str, ...], "asyncio.Future"] = {}
+        self._result_cache: Dict[Tuple[str, ...], Tuple[Any, float]] = {}
+
+        # Coalesces concurrent URL lookups into one multi-line phantom launch
+        self._url_batcher = _UrlFinderBatcher(self)
+
+        # Expose the webhook secret to the callback route's token check.
+        if self.config.webhook_url and self.config.webhook_secret:
+            LinkedInPlugin._webhook_secret = self.config.webhook_secret
+
         logger.info(
             f"Rate limiter initialized: {self.config.rate_limit.max_calls_per_hour} "
             f"calls/hour, {self.config.rate_limit.max_calls_per_day} calls/day, "
@@ -126,6 +311,7 @@ class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
                 - fetch_profile (bool): Whether to fetch profile. Default: True.
         """
         # Extract arguments from the dictionary
+        self._session = arguments.get("session")
         company_name = arguments["company_name"]
         city = arguments["city"]
         fetch_posts = arguments.get("fetch_posts", False)
@@ -138,19 +324,38 @@ class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
             # Return an empty list of events to respect the method signature
             return []
 
-        # Step 2: Fetch profile if requested
-        profile_data = None
+        # Steps 2 & 3: Fetch profile and posts concurrently when both are
+        # requested — they only depend on the URL and hit separate phantoms
+        # (independent rate-limit buckets), so the round trips overlap.
+        profile_task = None
         if fetch_profile:
             logger.info(f"Fetching profile data for: {url}")
-            profile_data = await self.fetch_profile(url)
+            profile_task = asyncio.create_task(self.fetch_profile(url))
 
-        # Step 3: Fetch posts if requested
-        posts: List[dict] = []
+        posts_task = None
         if fetch_posts:
             logger.info(f"Fetching posts for: {url}")
-            fetched_posts = await self.fetch_posts(url)
+            posts_task = asyncio.create_task(self.fetch_posts(url))
+
+        pending = [task for task in (profile_task, posts_task) if task is not None]
+        if pending:
+            # return_exceptions: one failing phantom must not cancel the other
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        profile_data = None
+        if profile_task is not None:
+            error = profile_task.exception()
+            if error is not None:
+                raise error
+            profile_data = profile_task.result()
+
+        posts: List[dict] = []
+        if posts_task is not None:
+            error = posts_task.exception()
+            if error is not None:
+                raise error
             # Coerce to list to avoid iterating over None
-            posts = fetched_posts or []
+            posts = posts_task.result() or []
         else:
             posts = [
                 {
@@ -160,72 +365,142 @@ class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
                 }
             ]
 
-        events: List[Event] = []
-        for p in posts:
-            try:
-                event = Event(
-                    source="linkedin",
-                    source_type="company news",
-                    title=p.get("author"),
-                    text=p.get("postContent", ""),
-                    url=p.get("postUrl"),
-                    published_at=(
-                        datetime.fromisoformat(p["postTimestamp"].replace("Z", "+00:00"))
-                        if p.get("postTimestamp")
-                        else None
-                    ),
-                    profile_data=profile_data,
-                )
-                events.append(event)
-            except Exception as e:
-                logger.error(f"Error processing post: {e}")
+        # model_construct: fields are already cleaned/typed, skip validation.
+        # Bad timestamps are handled (and logged) inside _parse_ts, so there is
+        # no broad try/except left to silently swallow construction bugs.
+        return [
+            Event.model_construct(
+                source="linkedin",
+                source_type="company news",
+                title=p.get("author"),
+                text=p.get("postContent", ""),
+                url=p.get("postUrl"),
+                published_at=_parse_ts(p.get("postTimestamp")),
+                profile_data=profile_data,
+            )
+            for p in posts
+        ]
+
+    async def _deduplicated(
+        self,
+        key: Tuple[str, ...],
+        ttl: float,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run `factory` once per key: duplicates await the in-flight call.
+
+        Completed results are cached for `ttl` seconds, so repeated lookups of
+        the same company/URL do not consume PhantomBuster quota at all.
+        """
+        loop = asyncio.get_running_loop()
+
+        # Serve a still-fresh completed result.
+        cached = self._result_cache.get(key)
+        if cached is not None and cached[1] > loop.time():
+            logger.info("Serving cached PhantomBuster result for {}", key)
+            return cached[0]
+
+        # Join an identical call that is already running.
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
 
-        return events
+        future: asyncio.Future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            result = await factory()
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark handled in case no duplicate caller ever awaits the future.
+            future.exception()
+            raise
+        else:
+            if len(self._result_cache) >= _CACHE_MAX_ENTRIES:
+                now = loop.time()
+                self._result_cache = {
+                    k: v for k, v in self._result_cache.items() if v[1] > now
+                }
+            self._result_cache[key] = (result, loop.time() + ttl)
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
 
     # Helper functions
     async def fetch_url(self, company_name: str, city: str) -> Optional[str]:
         """Find a company's LinkedIn URL using its business name and city."""
+        return await self._deduplicated(
+            ("url", company_name.lower(), city.lower()),
+            _URL_CACHE_TTL,
+            lambda: self._fetch_url_uncached(company_name, city),
+        )
+
+    async def _fetch_url_uncached(self, company_name: str, city: str) -> Optional[str]:
+        """Resolve a LinkedIn URL through PhantomBuster, bypassing the cache.
+
+        Goes through the batcher: lookups issued close together share one
+        multi-line url_finder launch instead of consuming a launch each.
+        """
+        linkedin_url = await self._url_batcher.submit(company_name, city)
+
+        if not linkedin_url:
+            logger.info("No URL found.")
+            return None
+
+        return linkedin_url
+
+    async def _launch_url_finder_batch(
+        self, pairs: List[Tuple[str, str]]
+    ) -> List[Optional[str]]:
+        """Resolve several (company, city) pairs with one url_finder launch.
+
+        Returns one Optional URL per input pair, matched by row index.
+        """
         arguments = {
             "csvName": "result",
-            "spreadsheetUrl": f"{company_name} {city}",
-            "numberOfLinesToProcess": 1,
+            "spreadsheetUrl": "\n".join(f"{name} {city}" for name, city in pairs),
+            "numberOfLinesToProcess": len(pairs),
             "sessionCookie": self.config.session_cookie,
             "userAgent": self.config.user_agent,
         }
 
-        logger.info(f"Launching phantom for '{company_name}' in '{city}'...")
+        logger.info(f"Launching phantom for {len(pairs)} URL lookup(s)...")
         try:
             result = await self.launch_and_fetch_phantom_result(
-                self.config.phantoms.url_finder_id, arguments
+                self.config.phantoms.url_finder_id, arguments, max_items=len(pairs)
             )
         except LinkedInPluginError:
             raise
         except Exception as exc:  # pragma: no cover - guard for unexpected runtime failures
             logger.exception(
-                "Unexpected error while fetching LinkedIn URL for '%s' in '%s'", company_name, city
+                "Unexpected error while fetching LinkedIn URLs for %s pairs", len(pairs)
             )
             raise LinkedInPluginError("Failed to retrieve LinkedIn URL") from exc
 
         if not result:
             logger.info("No result found.")
-            return None
+            return [None] * len(pairs)
 
-        try:
-            first_row = result[0]
-        except (IndexError, TypeError) as exc:
-            logger.error("Invalid payload format while reading LinkedIn URL: %s", exc)
-            raise LinkedInPluginError("Invalid response format when fetching LinkedIn URL") from exc
-
-        linkedin_url = first_row.get("linkedinUrl") if isinstance(first_row, dict) else None
-
-        if not linkedin_url:
-            logger.info("No URL found.")
-            return None
+        if not isinstance(result, list):
+            logger.error("Invalid payload format while reading LinkedIn URLs: %s", type(result))
+            raise LinkedInPluginError("Invalid response format when fetching LinkedIn URL")
 
-        return linkedin_url
+        urls: List[Optional[str]] = []
+        for i in range(len(pairs)):
+            row = result[i] if i < len(result) else None
+            urls.append(row.get("linkedinUrl") if isinstance(row, dict) else None)
+        return urls
 
     async def fetch_profile(self, url: str) -> Optional[dict]:
         """Extract profiling information using the found URL."""
+        return await self._deduplicated(
+            ("profile", url),
+            _PROFILE_CACHE_TTL,
+            lambda: self._fetch_profile_uncached(url),
+        )
+
+    async def _fetch_profile_uncached(self, url: str) -> Optional[dict]:
+        """Fetch profile data through PhantomBuster, bypassing the cache."""
         arguments = {
             "companiesPerLaunch": 1,
             "delayBetween": 2,
@@ -238,7 +513,7 @@ class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
         logger.info(f"Launching phantom for URL: '{url}'...")
         try:
             result = await self.launch_and_fetch_phantom_result(
-                self.config.phantoms.company_scraper_id, arguments
+                self.config.phantoms.company_scraper_id, arguments, max_items=1
             )
         except LinkedInPluginError:
             raise
@@ -269,6 +544,14 @@ class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
 
     async def fetch_posts(self, url: str) -> Optional[List[dict]]:
         """Fetch recent LinkedIn posts for an organization."""
+        return await self._deduplicated(
+            ("posts", url),
+            _POSTS_CACHE_TTL,
+            lambda: self._fetch_posts_uncached(url),
+        )
+
+    async def _fetch_posts_uncached(self, url: str) -> Optional[List[dict]]:
+        """Fetch recent posts through PhantomBuster, bypassing the cache."""
         arguments = {
             "numberOfLinesPerLaunch": 1,
             "numberMaxOfPosts": self.config.number_max_of_posts,
@@ -282,7 +565,9 @@ class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
         logger.info(f"Launching phantom for URL: '{url}' to extract company activities...")
         try:
             result = await self.launch_and_fetch_phantom_result(
-                self.config.phantoms.activity_extractor_id, arguments
+                self.config.phantoms.activity_extractor_id,
+                arguments,
+                max_items=self.config.number_max_of_posts,
             )
         except LinkedInPluginError:
             raise
@@ -299,12 +584,18 @@ class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
 
         return result
 
-    async def launch_and_fetch_phantom_result(self, phantom_id: str, arguments: dict) -> dict:
+    async def launch_and_fetch_phantom_result(
+        self, phantom_id: str, arguments: dict, max_items: Optional[int] = None
+    ) -> dict:
         """Generic helper that launches a PhantomBuster agent and retrieves its JSON output.
 
         Originally created to avoid duplicating PhantomBuster logic across
         fetch_url(), fetch_profile(), and fetch_posts().
 
+        ``max_items`` caps how many result rows are kept: callers that only
+        read the first row (URL/profile lookups) pass 1 so the rest of a large
+        payload is released immediately instead of being carried around.
+
         IMPORTANT: Uses rate limiter context manager to ensure semaphore
         is held for the ENTIRE duration of the API call.
         """
@@ -323,108 +614,237 @@ class LinkedInPlugin(BasePlugin[LinkedInPluginConfig]):
             # Set a timeout for HTTP requests (to prevent hanging)
             default_timeout = aiohttp.ClientTimeout(total=10)
 
-            # Prepare the payload containing the Phantom ID and its launch arguments
+            # Prepare the payload containing the Phantom ID and its launch arguments.
+            # With a webhook configured, PhantomBuster pushes the completion
+            # notification to us instead of being polled.
+            if self.config.webhook_url:
+                notification_url = self.config.webhook_url
+                if self.config.webhook_secret:
+                    sep = "&" if "?" in notification_url else "?"
+                    notification_url = f"{notification_url}{sep}token={self.config.webhook_secret}"
+                arguments = {**arguments, "notificationPayloadUrl": notification_url}
             payload = {"id": phantom_id, "arguments": arguments}
 
-            # Step 1: Launch the PhantomBuster agent via POST request
-            try:
-                async with aiohttp.ClientSession(timeout=default_timeout) as session:
-                    async with session.post(
-                        self.launch_url, headers=self.headers, json=payload, ssl=False
-                    ) as resp:
-                        resp.raise_for_status()  # Raise error if the request failed
-                        launch_resp = await resp.json()  # Parse the JSON response
-            except asyncio.TimeoutError as exc:
-                logger.error("Timeout launching PhantomBuster agent '%s': %s", phantom_id, exc)
-                raise LinkedInPluginError("Timed out while launching PhantomBuster agent") from exc
-            except aiohttp.ClientError as exc:
-                logger.error("HTTP error launching PhantomBuster agent '%s': %s", phantom_id, exc)
-                raise LinkedInPluginError("HTTP error while launching PhantomBuster agent") from exc
-
-            # Extract the launch container ID returned by PhantomBuster
-            launch_response_id = launch_resp.get("containerId")
-            if not launch_response_id:
-                raise LinkedInPluginError(
-                    "Unable to launch PhantomBuster agent: missing containerId"
-                )
+            # Reuse the pipeline-wide session when available so every request in
+            # this launch shares one TCP/TLS connection; otherwise fall back to
+            # the plugin-owned long-lived session.
+            session = self._get_session()
+
+            return await self._launch_and_poll(
+                session, phantom_id, payload, default_timeout, max_items
+            )
 
-            logger.info(f"Phantom launched with ID: {launch_response_id}")
-            logger.info("Waiting for result...")
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the injected pipeline session or a lazily-created owned one."""
+        if self._session is not None:
+            return self._session
 
-            # Step 2: Poll PhantomBuster until the job result becomes available
-            result = None
-            for attempt in range(30):
-                # Query the PhantomBuster output endpoint
+        if self._owned_session is None or self._owned_session.closed:
+            self._owned_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+
+        return self._owned_session
+
+    async def close(self) -> None:
+        """Close the plugin-owned HTTP session, if one was created."""
+        if self._owned_session is not None and not self._owned_session.closed:
+            await self._owned_session.close()
+        self._owned_session = None
+
+    async def _launch_and_poll(
+        self,
+        session: aiohttp.ClientSession,
+        phantom_id: str,
+        payload: dict,
+        default_timeout: aiohttp.ClientTimeout,
+        max_items: Optional[int] = None,
+    ) -> dict:
+        """Launch a phantom and poll for its JSON result on a given HTTP session."""
+        # Step 1: Launch the PhantomBuster agent via POST request
+        try:
+            async with session.post(
+                self.launch_url,
+                headers=self.headers,
+                json=payload,
+                ssl=False,
+                timeout=default_timeout,
+            ) as resp:
+                resp.raise_for_status()  # Raise error if the request failed
+                launch_resp = await resp.json()  # Parse the JSON response
+        except asyncio.TimeoutError as exc:
+            logger.error("Timeout launching PhantomBuster agent '%s': %s", phantom_id, exc)
+            raise LinkedInPluginError("Timed out while launching PhantomBuster agent") from exc
+        except aiohttp.ClientError as exc:
+            logger.error("HTTP error launching PhantomBuster agent '%s': %s", phantom_id, exc)
+            raise LinkedInPluginError("HTTP error while launching PhantomBuster agent") from exc
+
+        # Extract the launch container ID returned by PhantomBuster
+        launch_response_id = launch_resp.get("containerId")
+        if not launch_response_id:
+            raise LinkedInPluginError("Unable to launch PhantomBuster agent: missing containerId")
+
+        logger.info(f"Phantom launched with ID: {launch_response_id}")
+        logger.info("Waiting for result...")
+
+        # Push path: when a webhook is configured the callback delivers the
+        # result URL directly — zero wasted polls, latency equals true phantom
+        # runtime. Polling below remains the fallback (webhook unreachable,
+        # stale callback, download failure).
+        if self.config.webhook_url:
+            json_url = await self._wait_for_webhook(launch_response_id)
+            if json_url is not None:
                 try:
-                    async with aiohttp.ClientSession(timeout=default_timeout) as session:
-                        async with session.get(
-                            self.fetch_output_url,
-                            headers=self.headers,
-                            params={"id": phantom_id},
-                            ssl=False,
-                        ) as r:
-                            r.raise_for_status()
-                            out = await r.json()
-                except asyncio.TimeoutError as exc:
+                    result = await self._download_result(
+                        session, json_url, default_timeout, max_items
+                    )
+                    logger.info("JSON result downloaded successfully.")
+                    return result
+                except (asyncio.TimeoutError, aiohttp.ClientError) as exc:
                     logger.warning(
-                        "Timeout polling PhantomBuster output for '%s' (attempt %s): %s",
+                        "Failed to download webhook result for '%s': %s; falling back to polling",
                         phantom_id,
-                        attempt + 1,
                         exc,
                     )
-                    await asyncio.sleep(5)
-                    continue
-                except aiohttp.ClientError as exc:
-                    logger.error(
-                        "HTTP error polling PhantomBuster output '%s': %s", phantom_id, exc
-                    )
-                    raise LinkedInPluginError(
-                        "HTTP error while polling PhantomBuster output"
-                    ) from exc
-
-                # Check if the output contains a link to the result JSON
-                if out and "output" in out:
-                    log_output = out["output"]
-                    json_match = re.search(r"https://\S+result\.json", log_output)
-                    if json_match:
-                        json_url = json_match.group(0)
-                        logger.info(f"Result found! Downloading from: {json_url}")
-
-                        # Step 3: Download the actual JSON result from the provided URL
+
+        # Step 2: Poll PhantomBuster until the job result becomes available.
+        # Exponential backoff with jitter: fast phantoms complete within a poll
+        # or two, slow ones get the full deadline instead of a fixed retry count.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _POLL_DEADLINE
+        result = None
+        attempt = 0
+        while loop.time() < deadline:
+            # Backoff delay for this attempt: 1s, 2s, 4s, ... capped, with
+            # +/-20% jitter to avoid synchronized polling across phantoms.
+            delay = min(_POLL_MAX_DELAY, 2.0 ** min(attempt, 4))
+            delay *= 0.8 + 0.4 * random.random()  # nosec B311
+
+            # Query the PhantomBuster output endpoint
+            try:
+                async with session.get(
+                    self.fetch_output_url,
+                    headers=self.headers,
+                    params={"id": phantom_id},
+                    ssl=False,
+                    timeout=default_timeout,
+                ) as r:
+                    # Honor server throttling hints before treating 429 as fatal
+                    if r.status == 429:
                         try:
-                            async with aiohttp.ClientSession(timeout=default_timeout) as session:
-                                async with session.get(json_url, ssl=False) as result_resp:
-                                    result_resp.raise_for_status()
-                                    result = await result_resp.json()
-                                    logger.info("JSON result downloaded successfully.")
-                                    break  # Exit polling loop once result is obtained
-                        except asyncio.TimeoutError as exc:
-                            logger.warning(
-                                "Timeout downloading PhantomBuster result for '%s': %s",
-                                phantom_id,
-                                exc,
-                            )
-                            await asyncio.sleep(5)
-                            continue
-                        except aiohttp.ClientError as exc:
-                            logger.error(
-                                "HTTP error downloading PhantomBuster result '%s': %s",
-                                phantom_id,
-                                exc,
-                            )
-                            raise LinkedInPluginError(
-                                "HTTP error while downloading PhantomBuster result"
-                            ) from exc
-
-                # Wait 5 seconds before retrying if no result yet
-                logger.debug(f"[{attempt + 1}] No result yet — retrying in 5s...")
-                await asyncio.sleep(5)
-
-            if result is None:
-                logger.error(
-                    "PhantomBuster agent '%s' completed without producing a result.", phantom_id
+                            delay = float(r.headers.get("Retry-After", delay))
+                        except ValueError:
+                            # Retry-After may be an HTTP-date (RFC 7231) rather
+                            # than seconds; keep the computed backoff delay.
+                            pass
+                        logger.warning(
+                            "PhantomBuster throttled polling for '%s'; retrying in %.1fs",
+                            phantom_id,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+                        attempt += 1
+                        continue
+                    r.raise_for_status()
+                    out = await r.json()
+            except asyncio.TimeoutError as exc:
+                logger.warning(
+                    "Timeout polling PhantomBuster output for '%s' (attempt %s): %s",
+                    phantom_id,
+                    attempt + 1,
+                    exc,
                 )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except aiohttp.ClientError as exc:
+                logger.error("HTTP error polling PhantomBuster output '%s': %s", phantom_id, exc)
+                raise LinkedInPluginError("HTTP error while polling PhantomBuster output") from exc
+
+            # Check if the output contains a link to the result JSON
+            if out and "output" in out:
+                log_output = out["output"]
+                json_match = _RESULT_JSON_RE.search(log_output[-_RESULT_LOG_TAIL:])
+                if json_match:
+                    json_url = json_match.group(0)
+                    logger.info(f"Result found! Downloading from: {json_url}")
+
+                    # Step 3: Download the actual JSON result from the provided URL
+                    try:
+                        result = await self._download_result(
+                            session, json_url, default_timeout, max_items
+                        )
+                        logger.info("JSON result downloaded successfully.")
+                        break  # Exit polling loop once result is obtained
+                    except asyncio.TimeoutError as exc:
+                        logger.warning(
+                            "Timeout downloading PhantomBuster result for '%s': %s",
+                            phantom_id,
+                            exc,
+                        )
+                        await asyncio.sleep(delay)
+                        attempt += 1
+                        continue
+                    except aiohttp.ClientError as exc:
+                        logger.error(
+                            "HTTP error downloading PhantomBuster result '%s': %s",
+                            phantom_id,
+                            exc,
+                        )
+                        raise LinkedInPluginError(
+                            "HTTP error while downloading PhantomBuster result"
+                        ) from exc
+
+            # Back off before retrying if no result yet
+            logger.debug(f"[{attempt + 1}] No result yet — retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if result is None:
+            logger.error(
+                "PhantomBuster agent '%s' completed without producing a result.", phantom_id
+            )
 
-            # Return the parsed JSON result (or None if not found)
-            # Le semaphore se libère automatiquement ici à la sortie du 'async with'
-            return result
+        # Return the parsed JSON result (or None if not found)
+        # Le semaphore se libère automatiquement à la sortie du 'acquire' context manager
+        return result
+
+    async def _wait_for_webhook(self, container_id: str) -> Optional[str]:
+        """Wait for the result-JSON URL pushed by the completion webhook.
+
+        Returns None on timeout so the caller can fall back to polling.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending_containers[container_id] = future
+        try:
+            return await asyncio.wait_for(future, timeout=_WEBHOOK_WAIT)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "No webhook callback for container '%s'; falling back to polling", container_id
+            )
+            return None
+        finally:
+            self._pending_containers.pop(container_id, None)
+
+    @staticmethod
+    async def _download_result(
+        session: aiohttp.ClientSession,
+        json_url: str,
+        default_timeout: aiohttp.ClientTimeout,
+        max_items: Optional[int],
+    ) -> Any:
+        """Download and parse a result-JSON payload, keeping at most max_items rows."""
+        async with session.get(json_url, ssl=False, timeout=default_timeout) as result_resp:
+            result_resp.raise_for_status()
+            raw = await result_resp.read()
+
+        # Parse off-loop: result blobs can reach hundreds of rows and
+        # json.loads would otherwise block every other coroutine.
+        result = await asyncio.to_thread(json.loads, raw)
+        if max_items is not None and isinstance(result, list):
+            # Drop unneeded rows right away so the full payload is not
+            # kept alive past this point.
+            del result[max_items:]
+        return result
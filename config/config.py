@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -37,34 +38,55 @@ class ConfigLoader:
 
     @staticmethod
     def load_config(config_path: str = "config/config.yaml") -> AppConfig:
-        """Load the YAML file and convert it into a structured AppConfig."""
+        """Load the YAML file and convert it into a structured AppConfig.
+
+        Parses are memoized on (path, mtime): repeated calls for an unchanged
+        file are a dict lookup, while editing the file invalidates the entry.
+        """
+        path = Path(config_path)
+
         # Checks if the file exists
-        if not Path(config_path).exists():
+        if not path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        # Loads the YAML
-        cfg = OmegaConf.load(config_path)
+        return _load_config_cached(str(config_path), path.stat().st_mtime)
 
-        # Resolves the interpolations
-        OmegaConf.resolve(cfg)
+    @staticmethod
+    def load_sources(config_path: str = "config/config.yaml") -> List[SourceConfig]:
+        """Load only the list of sources.
 
-        # Converts to a typed structure
+        Converts just the `sources` subtree instead of running the full
+        structured-object conversion of `load_config` — the rest of the tree
+        never leaves its (cached) OmegaConf form.
+        """
+        path = Path(config_path)
 
-        return OmegaConf.to_object(cfg)
+        # Checks if the file exists
+        if not path.exists():
+            raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    @staticmethod
-    def load_sources(config_path: str = "config/config.yaml") -> List[SourceConfig]:
-        """Load only the list of sources."""
-        app_config = ConfigLoader.load_config(config_path)
-        if hasattr(app_config, "sources"):
-            return getattr(app_config, "sources")
-
-        if isinstance(app_config, dict):
-            raw_sources = app_config.get("sources", [])
-            return [
-                SourceConfig(**raw_source)
-                for raw_source in raw_sources
-                if isinstance(raw_source, dict)
-            ]
-
-        raise TypeError("Config object could not be interpreted as AppConfig")
+        cfg = _load_raw(str(config_path), path.stat().st_mtime)
+        raw_sources = cfg.get("sources") or []
+        return [
+            SourceConfig(**raw_source)
+            for raw_source in OmegaConf.to_container(raw_sources, resolve=True)
+            if isinstance(raw_source, dict)
+        ]
+
+
+@lru_cache(maxsize=8)
+def _load_raw(config_path: str, _mtime: float):
+    """Load and resolve the YAML; `_mtime` only keys the cache for invalidation."""
+    # Loads the YAML
+    cfg = OmegaConf.load(config_path)
+
+    # Resolves the interpolations
+    OmegaConf.resolve(cfg)
+
+    return cfg
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> AppConfig:
+    """Convert the (cached) resolved config to a typed structure."""
+    return OmegaConf.to_object(_load_raw(config_path, mtime))
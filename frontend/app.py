@@ -1,3 +1,4 @@
+import html
 from pathlib import Path
 
 import streamlit as st
@@ -17,54 +18,8 @@ from models.company_sheet import CompanySheet
 from services.api_client import get_api_client
 
 
-def load_css():
-    """Load CSS styles from the static directory."""
-    script_dir = Path(__file__).parent
-    css_path = script_dir / "static" / "styles.css"
-
-    with open(css_path) as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-
-
-@st.cache_data(ttl=3600, show_spinner=False)  # Cache pendant 1 heure pour éviter les re-appels backend/LLM
-def load_company_data_cached(company_id: str):
-    """Charge les données de l'entreprise avec mise en cache.
-    
-    Cette fonction sera appelée UNE SEULE FOIS même si st.rerun() est déclenché
-    par le composant partnership_description. Les appels LLM/backend ne se feront
-    qu'au premier chargement.
-    """
-    print(f"\n🔄 [BACKEND] Chargement des données pour {company_id}")
-    print(f"💰 [BACKEND] Appel LLM/API en cours - Ceci ne devrait apparaître qu'UNE SEULE FOIS")
-    
-    # Chargement des données depuis le backend avec appels LLM
-    sheet = CompanySheet(company_id)
-    sheet.load_all_data()  # Appels backend + LLM coûteux
-    
-    print(f"✅ [BACKEND] Données chargées et mises en cache pour {company_id}")
-    
-    return {
-        "identity_data": sheet.identity_data,
-        "contact_data": sheet.contact_data,
-        "credit_data": sheet.credit_data,
-        "partnership_data": sheet.partnership_data,
-        "revenue_data": sheet.revenue_data,
-        "complaints_data": sheet.complaints_data,
-        "news_data": sheet.news_data,
-        "offers_data": sheet.offers_data,
-        "potential_data": sheet.potential_data
-    }
-
-
-def main():
-    """Main application function avec cache intelligent."""
-    st.set_page_config(page_title="Fiche Client B2B", page_icon="🟠", layout="wide")
-
-    load_css()
-
-    # CSS pour créer un spinner orange centré qui ne perturbe pas la mise en page
-    st.markdown("""
-    <style>
+# CSS pour créer un spinner orange centré qui ne perturbe pas la mise en page
+_SPINNER_CSS = """
     /* Container du spinner - centré et positionné */
     .stSpinner {
         position: relative !important;
@@ -134,13 +89,10 @@ def main():
         align-items: center !important;
         width: 100% !important;
     }
-    </style>
-    """, unsafe_allow_html=True)
+    """
 
-    # FORCE CSS FOR SEARCH BAR BEFORE RENDERING IT
-    st.markdown(
-        """
-        <style>
+# FORCE CSS FOR SEARCH BAR BEFORE RENDERING IT
+_BUTTONS_CSS = """
         /* FORCE ORANGE BUTTON - APPLIED BEFORE SEARCH BAR RENDER */
         button[kind="formSubmit"],
         .stFormSubmitButton button,
@@ -226,15 +178,10 @@ def main():
         [data-testid="stForm"] [data-testid="column"] {
             gap: 0.7rem !important;
         }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    # CSS supplémentaire pour harmoniser les messages avec le thème Orange
-    st.markdown(
         """
-        <style>
+
+# CSS supplémentaire pour harmoniser les messages avec le thème Orange
+_ALERTS_CSS = """
         /* Styles pour harmoniser les messages avec le thème Orange */
         .stAlert > div {
             border-radius: 8px !important;
@@ -260,11 +207,103 @@ def main():
         .main .block-container {
             padding-top: 2rem !important;
         }
-        </style>
-        """,
+        """
+
+# Concaténé une fois à l'import : un seul passage de sérialisation Streamlit
+# par rerun au lieu de trois.
+_CSS_BLOB = _SPINNER_CSS + _BUTTONS_CSS + _ALERTS_CSS
+
+
+@st.cache_data(show_spinner=False)
+def _read_css_file() -> str:
+    """Read the static stylesheet once; reruns hit the Streamlit cache."""
+    css_path = Path(__file__).parent / "static" / "styles.css"
+    with open(css_path) as f:
+        return f.read()
+
+
+def load_css():
+    """Load CSS styles from the static directory."""
+    st.markdown(f"<style>{_read_css_file()}</style>", unsafe_allow_html=True)
+    # Feuille de style partenariat servie statiquement (enableStaticServing) :
+    # le navigateur la met en cache, rien ne repasse par le WebSocket.
+    st.markdown(
+        '<link rel="stylesheet" href="app/static/partnership.css">',
         unsafe_allow_html=True,
     )
 
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_health_check() -> bool:
+    """Health check mis en cache 30s : évite un aller-retour HTTP par rerun."""
+    return get_api_client().health_check()
+
+
+def _escape_html_strings(data):
+    """Échappe récursivement les chaînes d'une structure dict/list.
+
+    Les valeurs non textuelles (nombres, DataFrames…) sont renvoyées telles
+    quelles.
+    """
+    if isinstance(data, dict):
+        return {key: _escape_html_strings(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_escape_html_strings(value) for value in data]
+    if isinstance(data, str):
+        return html.escape(data)
+    return data
+
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache pendant 1 heure pour éviter les re-appels backend/LLM
+def load_company_data_cached(company_id: str):
+    """Charge les données de l'entreprise avec mise en cache.
+    
+    Cette fonction sera appelée UNE SEULE FOIS même si st.rerun() est déclenché
+    par le composant partnership_description. Les appels LLM/backend ne se feront
+    qu'au premier chargement.
+    """
+    print(f"\n🔄 [BACKEND] Chargement des données pour {company_id}")
+    print(f"💰 [BACKEND] Appel LLM/API en cours - Ceci ne devrait apparaître qu'UNE SEULE FOIS")
+    
+    # Chargement des données depuis le backend avec appels LLM
+    sheet = CompanySheet(company_id)
+    sheet.load_all_data()  # Appels backend + LLM coûteux
+    
+    print(f"✅ [BACKEND] Données chargées et mises en cache pour {company_id}")
+
+    # Échappement HTML une seule fois à l'ingestion : les renderers peuvent
+    # ensuite interpoler les valeurs telles quelles dans unsafe_allow_html
+    # sans risque XSS ni ré-échappement par rerun.
+    identity_data = _escape_html_strings(sheet.identity_data)
+
+    # Pré-calcul à l'ingestion (une fois par fetch, pas par rerun) : l'adresse
+    # multi-lignes est prête à interpoler côté rendu.
+    if identity_data and identity_data.get("address"):
+        identity_data["address_html"] = identity_data["address"].replace(",", "<br>")
+
+    return {
+        "identity_data": identity_data,
+        "contact_data": _escape_html_strings(sheet.contact_data),
+        "credit_data": _escape_html_strings(sheet.credit_data),
+        "partnership_data": _escape_html_strings(sheet.partnership_data),
+        "revenue_data": sheet.revenue_data,
+        "complaints_data": _escape_html_strings(sheet.complaints_data),
+        "news_data": _escape_html_strings(sheet.news_data),
+        "offers_data": _escape_html_strings(sheet.offers_data),
+        "potential_data": _escape_html_strings(sheet.potential_data)
+    }
+
+
+def main():
+    """Main application function avec cache intelligent."""
+    st.set_page_config(page_title="Fiche Client B2B", page_icon="🟠", layout="wide")
+
+    load_css()
+
+    # Une seule injection CSS par rerun : les trois blocs (spinner, boutons,
+    # messages) sont concaténés au chargement du module dans _CSS_BLOB.
+    st.markdown(f"<style>{_CSS_BLOB}</style>", unsafe_allow_html=True)
+
     header.render_header()
 
     search_bar.render_search_bar()
@@ -290,8 +329,7 @@ def main():
             print(f"🔄 [APP] Rendu de l'interface - Données récupérées du cache")
 
             # Afficher un message de succès stylisé si les données viennent du backend
-            api_client = get_api_client()
-            if api_client.health_check():
+            if _cached_health_check():
                 # Message de succès personnalisé avec style Orange
                 st.markdown(
                     f"""
@@ -389,11 +427,9 @@ def main():
                 # Créer un objet CompanySheet pour les appels API (léger, pas de chargement de données)
                 company_sheet = CompanySheet(company_id)
 
-
-                # OU si vous voulez éviter de créer un nouvel objet, vous pouvez directement créer une instance inline :
                 partnership_description.render_partnership_description(
-                    cached_data["partnership_data"], 
-                    CompanySheet(company_id)
+                    cached_data["partnership_data"],
+                    company_sheet,
                     )
 
             graph_col, plaintes_col = st.columns([2, 1], gap="medium")
@@ -404,9 +440,14 @@ def main():
             with plaintes_col:
                 complaints_section.render_complaints_section(cached_data["complaints_data"])
 
-            news_section.render_news_section(cached_data["news_data"])
+            # Sections sous la ligne de flottaison : repliées par défaut, le
+            # navigateur diffère la mise en page de leur HTML tant qu'elles
+            # ne sont pas ouvertes.
+            with st.expander("Actualités", expanded=False):
+                news_section.render_news_section(cached_data["news_data"])
 
-            offers_potential.render_offers_potential(cached_data["offers_data"], cached_data["potential_data"])
+            with st.expander("Offres et Potentiel", expanded=False):
+                offers_potential.render_offers_potential(cached_data["offers_data"], cached_data["potential_data"])
 
         except Exception as e:
             st.error(f"❌ Erreur lors du chargement des données : {e!s}")
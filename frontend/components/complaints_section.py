@@ -1,18 +1,11 @@
-import streamlit as st
-
+from string import Template
 
-def render_complaints_section(complaints_data: dict):
-    """Render the complaints section.
+import streamlit as st
 
-    Args:
-        complaints_data: Dictionary containing complaint information
+# Compiled once at import: reruns only substitute the three values instead of
+# rebuilding the whole HTML block through f-string machinery.
+_COMPLAINTS_TMPL = Template(
     """
-    if not complaints_data:
-        st.error("Données de plaintes non disponibles")
-        return
-
-    st.markdown(
-        f"""
     <div class="white-section" style="height: 700px; display: flex; flex-direction: column;">
         <h3 class="section-title">Plaintes enregistrées</h3>
         <div
@@ -25,16 +18,34 @@ def render_complaints_section(complaints_data: dict):
             "
         >
             <div>
-                <p style="color: #FF7900; font-weight: bold; margin-bottom: 10px;">• {complaints_data.get("title", "N/A")}</p>
+                <p style="color: #FF7900; font-weight: bold; margin-bottom: 10px;">• $title</p>
                 <p style="color: #000000; margin-bottom: 15px; line-height: 1.6;">
-                    {complaints_data.get("description", "N/A")}
+                    $description
                 </p>
                 <p style="color: #000000; margin-bottom: 0; line-height: 1.6;">
-                    {complaints_data.get("resolution", "N/A")}
+                    $resolution
                 </p>
             </div>
         </div>
     </div>
-    """,
-        unsafe_allow_html=True,
+    """
+)
+
+
+def render_complaints_section(complaints_data: dict):
+    """Render the complaints section.
+
+    Args:
+        complaints_data: Dictionary containing complaint information
+    """
+    if not complaints_data:
+        st.error("Données de plaintes non disponibles")
+        return
+
+    st.html(
+        _COMPLAINTS_TMPL.substitute(
+            title=complaints_data.get("title", "N/A"),
+            description=complaints_data.get("description", "N/A"),
+            resolution=complaints_data.get("resolution", "N/A"),
+        )
     )
@@ -1,5 +1,20 @@
+from string import Template
+
 import streamlit as st
 
+# Compiled once at import: reruns only substitute the contact values instead
+# of rebuilding the whole HTML block through f-string machinery.
+_CONTACT_TMPL = Template(
+    """
+    <div class="contact-section">
+        <h3 class="section-title">Contact</h3>
+        <p style="margin: 8px 0; color: #000000 !important;">Nom complet : <strong>$name</strong></p>
+        <p style="margin: 8px 0; color: #000000 !important;">Numéro de téléphone : $phone</p>
+        <p style="margin: 8px 0;"><a href="mailto:Email: $email_href" style="color: #FF7900;">$email</a></p>
+    </div>
+    """
+)
+
 
 def render_contact_section(contact_data: dict):
     """Render the contact information section.
@@ -11,14 +26,11 @@ def render_contact_section(contact_data: dict):
         st.error("Données de contact non disponibles")
         return
 
-    st.markdown(
-        f"""
-    <div class="contact-section">
-        <h3 class="section-title">Contact</h3>
-        <p style="margin: 8px 0; color: #000000 !important;">Nom complet : <strong>{contact_data.get("name", "N/A")}</strong></p>
-        <p style="margin: 8px 0; color: #000000 !important;">Numéro de téléphone : {contact_data.get("phone", "N/A")}</p>
-        <p style="margin: 8px 0;"><a href="mailto:Email: {contact_data.get("email", "")}" style="color: #FF7900;">{contact_data.get("email", "N/A")}</a></p>
-    </div>
-    """,
-        unsafe_allow_html=True,
+    st.html(
+        _CONTACT_TMPL.substitute(
+            name=contact_data.get("name", "N/A"),
+            phone=contact_data.get("phone", "N/A"),
+            email_href=contact_data.get("email", ""),
+            email=contact_data.get("email", "N/A"),
+        )
     )
@@ -1,5 +1,35 @@
+from string import Template
+
 import streamlit as st
 
+# Compiled once at import: reruns only substitute the credit values instead
+# of rebuilding the whole HTML block through f-string machinery.
+_CREDIT_TMPL = Template(
+    """
+    <div class="creances-section">
+        <h3 class="section-title">État des créances</h3>
+        <p style="color: #000000 !important;">Statut : <span style="color: $status_color; font-weight: bold;">$status</span></p>
+        <p style="color: #000000 !important;">Montant des créances : $amount</p>
+        <p style="color: #000000 !important;">Ancienneté Moyenne : ${average_age}j</p>
+        <p style="color: #000000 !important;">Niveau de Risque client : $risk_level</p>
+    </div>
+    """
+)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_credit_html(items: tuple) -> str:
+    """Substitute the credit fields into the template, memoized per payload."""
+    credit_data = dict(items)
+    status_color = "green" if credit_data.get("status") == "À jour" else "red"
+    return _CREDIT_TMPL.substitute(
+        status_color=status_color,
+        status=credit_data.get("status", "N/A"),
+        amount=credit_data.get("amount", "N/A"),
+        average_age=credit_data.get("average_age", "N/A"),
+        risk_level=credit_data.get("risk_level", "N/A"),
+    )
+
 
 def render_credit_status(credit_data: dict):
     """Render the credit status section.
@@ -11,17 +41,6 @@ def render_credit_status(credit_data: dict):
         st.error("Données de crédit non disponibles")
         return
 
-    status_color = "green" if credit_data.get("status") == "À jour" else "red"
-
-    st.markdown(
-        f"""
-    <div class="creances-section">
-        <h3 class="section-title">État des créances</h3>
-        <p style="color: #000000 !important;">Statut : <span style="color: {status_color}; font-weight: bold;">{credit_data.get("status", "N/A")}</span></p>
-        <p style="color: #000000 !important;">Montant des créances : {credit_data.get("amount", "N/A")}</p>
-        <p style="color: #000000 !important;">Ancienneté Moyenne : {credit_data.get("average_age", "N/A")}j</p>
-        <p style="color: #000000 !important;">Niveau de Risque client : {credit_data.get("risk_level", "N/A")}</p>
-    </div>
-    """,
-        unsafe_allow_html=True,
+    st.html(
+        _build_credit_html(tuple(sorted(credit_data.items())))
     )
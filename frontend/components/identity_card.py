@@ -1,18 +1,24 @@
-import streamlit as st
+from string import Template
 
+import streamlit as st
 
-def render_identity_card(identity_data: dict):
-    """Render the company identity card section.
+# Static SVG icons, serialized once and spliced into the template at import.
+_LINKEDIN_SVG = """<svg viewBox="0 0 24 24" style="fill: #FF7900 !important;">
+                        <path
+                            d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"
+                        />
+                    </svg>"""
 
-    Args:
-        identity_data: Dictionary containing company identity information
-    """
-    if not identity_data:
-        st.error("Données d'identité non disponibles")
-        return
+_GLOBE_SVG = """<svg viewBox="0 0 24 24" style="fill: #FF7900 !important;">
+                        <path
+                            d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-1 17.93c-3.94-.49-7-3.85-7-7.93 0-.62.08-1.21.21-1.79L9 15v1c0 1.1.9 2 2 2v1.93zm6.9-2.54c-.26-.81-1-1.39-1.9-1.39h-1v-3c0-.55-.45-1-1-1H8v-2h2c.55 0 1-.45 1-1V7h2c1.1 0 2-.9 2-2v-.41c2.93 1.19 5 4.06 5 7.41 0 2.08-.8 3.97-2.1 5.39z"
+                        />
+                    </svg>"""
 
-    st.markdown(
-        f"""
+# Compiled once at import: the multi-kilobyte HTML (SVG icons, grid styles)
+# is static — reruns only substitute the handful of company fields.
+_IDENTITY_TMPL = Template(
+    f"""
     <div
         class="carte-identite"
         style="
@@ -40,28 +46,20 @@ def render_identity_card(identity_data: dict):
             </h2>
             <div class="social-icons">
                 <a
-                    href="{identity_data.get("linkedin_url", "#")}"
+                    href="$linkedin_url"
                     target="_blank"
                     class="social-icon"
                     style="color: #FF7900 !important;"
                 >
-                    <svg viewBox="0 0 24 24" style="fill: #FF7900 !important;">
-                        <path
-                            d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"
-                        />
-                    </svg>
+                    {_LINKEDIN_SVG}
                 </a>
                 <a
-                    href="{identity_data.get("website_url", "#")}"
+                    href="$website_url"
                     target="_blank"
                     class="social-icon"
                     style="color: #FF7900 !important;"
                 >
-                    <svg viewBox="0 0 24 24" style="fill: #FF7900 !important;">
-                        <path
-                            d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-1 17.93c-3.94-.49-7-3.85-7-7.93 0-.62.08-1.21.21-1.79L9 15v1c0 1.1.9 2 2 2v1.93zm6.9-2.54c-.26-.81-1-1.39-1.9-1.39h-1v-3c0-.55-.45-1-1-1H8v-2h2c.55 0 1-.45 1-1V7h2c1.1 0 2-.9 2-2v-.41c2.93 1.19 5 4.06 5 7.41 0 2.08-.8 3.97-2.1 5.39z"
-                        />
-                    </svg>
+                    {_GLOBE_SVG}
                     Site Web
                 </a>
             </div>
@@ -70,28 +68,28 @@ def render_identity_card(identity_data: dict):
             <div>
                 <div style="margin-bottom: 15px;">
                     <div style="color: #FFFFFF; font-size: 14px; font-weight: 600;">Raison Sociale</div>
-                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">{identity_data.get("company_name", "N/A")}</div>
+                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">$company_name</div>
                 </div>
                 <div>
                     <div style="color: #FFFFFF; font-size: 14px; font-weight: 600;">Dirigeant(s)</div>
-                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">{identity_data.get("ceo", "N/A")}</div>
+                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">$ceo</div>
                 </div>
             </div>
             <div>
                 <div style="margin-bottom: 15px;">
                     <div style="color: #FFFFFF; font-size: 14px; font-weight: 600;">Activité</div>
-                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">{identity_data.get("activity", "N/A")}</div>
+                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">$activity</div>
                 </div>
                 <div>
                     <div style="color: #FFFFFF; font-size: 14px; font-weight: 600;">Effectifs</div>
-                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">{identity_data.get("employees", "N/A")}</div>
+                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">$employees</div>
                 </div>
             </div>
             <div>
                 <div style="margin-bottom: 15px;">
                     <div style="color: #FFFFFF; font-size: 14px; font-weight: 600;">Adresse</div>
                     <a
-                        href="{identity_data.get("address_link", "#")}"
+                        href="$address_link"
                         target="_blank"
                         style="
                             color: #FF7900;
@@ -103,17 +101,55 @@ def render_identity_card(identity_data: dict):
                         "
                     >
                         <div style="color: #FF7900; font-size: 16px; font-weight: 400;">
-                            {identity_data.get("address", "N/A").replace(",", "<br>")}
+                            $address
                         </div>
                     </a>
                 </div>
                 <div>
                     <div style="color: #FFFFFF; font-size: 14px; font-weight: 600;">Autres Adresses</div>
-                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">{identity_data.get("other_addresses", "N/A")}</div>
+                    <div style="color: #FF7900; font-size: 16px; font-weight: 400;">$other_addresses</div>
                 </div>
             </div>
         </div>
     </div>
-    """,
-        unsafe_allow_html=True,
+    """
+)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_identity_html(items: tuple) -> str:
+    """Substitute the identity fields into the template, memoized per payload.
+
+    Streamlit reruns the whole script on every widget interaction; caching on
+    the (hashable) data items skips the substitution when nothing changed.
+    """
+    identity_data = dict(items)
+    return _IDENTITY_TMPL.substitute(
+        linkedin_url=identity_data.get("linkedin_url", "#"),
+        website_url=identity_data.get("website_url", "#"),
+        company_name=identity_data.get("company_name", "N/A"),
+        ceo=identity_data.get("ceo", "N/A"),
+        activity=identity_data.get("activity", "N/A"),
+        employees=identity_data.get("employees", "N/A"),
+        address_link=identity_data.get("address_link", "#"),
+        # address_html est pré-calculé à l'ingestion ; l'adresse brute sert
+        # de repli pour les payloads qui ne passent pas par le loader.
+        address=identity_data.get("address_html")
+        or identity_data.get("address", "N/A").replace(",", "<br>"),
+        other_addresses=identity_data.get("other_addresses", "N/A"),
+    )
+
+
+def render_identity_card(identity_data: dict):
+    """Render the company identity card section.
+
+    Args:
+        identity_data: Dictionary containing company identity information
+    """
+    if not identity_data:
+        st.error("Données d'identité non disponibles")
+        return
+
+    st.html(
+        _build_identity_html(tuple(sorted(identity_data.items())))
     )
@@ -11,25 +11,24 @@ def render_news_section(news_data: dict):
         st.error("Données d'actualités non disponibles")
         return
 
-    sector_context_html = ""
-    if news_data.get("sector_context"):
-        for item in news_data["sector_context"]:
-            sector_context_html += f"<p>- <strong>{item}</strong></p>"
+    # Single join per block: one allocation sized to the final string instead
+    # of a fresh intermediate string per += iteration.
+    sector_context_html = "".join(
+        f"<p>- <strong>{item}</strong></p>" for item in news_data.get("sector_context") or ()
+    )
 
-    cybersecurity_html = ""
-    if news_data.get("cybersecurity_focus"):
-        for item in news_data["cybersecurity_focus"]:
-            if item == "Tendance régionale (Interpol 2025) :":
-                cybersecurity_html += f"<p><strong>{item}</strong></p>"
-            else:
-                cybersecurity_html += f"<p>- {item}</p>"
+    cybersecurity_html = "".join(
+        f"<p><strong>{item}</strong></p>"
+        if item == "Tendance régionale (Interpol 2025) :"
+        else f"<p>- {item}</p>"
+        for item in news_data.get("cybersecurity_focus") or ()
+    )
 
-    company_news_html = ""
-    if news_data.get("company_news"):
-        for item in news_data["company_news"]:
-            company_news_html += f"<p>- {item}</p>"
+    company_news_html = "".join(
+        f"<p>- {item}</p>" for item in news_data.get("company_news") or ()
+    )
 
-    st.markdown(
+    st.html(
         f"""
     <div class="dark-section">
         <h3>Actualités</h3>
@@ -46,6 +45,5 @@ def render_news_section(news_data: dict):
             </div>
         </div>
     </div>
-    """,
-        unsafe_allow_html=True,
+    """
     )
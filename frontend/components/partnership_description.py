@@ -1,9 +1,39 @@
+import html
+from functools import lru_cache
+
 import streamlit as st
 
 
+@lru_cache(maxsize=256)
+def truncate_note(text, start_words=5, end_words=2):
+    """Tronque le texte : premiers mots + derniers mots.
+
+    Au niveau module (et mémoïsée) : la note sauvegardée change rarement,
+    inutile de recréer la fonction et de re-découper le texte à chaque rerun.
+    """
+    words = text.split()
+    if len(words) <= start_words + end_words:
+        return text
+
+    start_part = " ".join(words[:start_words])
+    end_part = " ".join(words[-end_words:])
+    return f"{start_part} ... {end_part}"
+
+
+# Gabarits de colonnes partagés par les différentes rangées de boutons.
+_CENTER_COLS = (1, 1, 1)
+_ACTION_COLS = (1, 1, 2)
+
+
+@st.fragment
 def render_partnership_description(partnership_data: dict, company_sheet=None):
     """Render the partnership description section.
 
+    Le fragment limite la portée des interactions (ajout/sauvegarde/annulation
+    de note) à cette section : les st.rerun() internes sont explicitement en
+    scope="fragment" (le défaut "app" rejouerait toute la page) et ne
+    rejouent donc que le fragment.
+
     Args:
         partnership_data: Dictionary containing partnership information
         company_sheet: CompanySheet instance for API calls
@@ -12,181 +42,37 @@ def render_partnership_description(partnership_data: dict, company_sheet=None):
         st.error("Données de partenariat non disponibles")
         return
 
-    # Créer un identifiant unique pour éviter les conflits de clés
-    unique_id = hash(str(partnership_data.get('start_date', '')))
+    # Lectures répétées liées à des locales : un seul accès session_state /
+    # dict par rerun au lieu d'un par site d'utilisation.
+    start_date = partnership_data.get("start_date")
 
-    # CSS intégré pour le style professionnel
-    st.markdown("""
-        <style>
-        /* CSS professionnel pour Orange Business Services - Notes de partenariat */
-        
-        /* Bouton principal "Ajouter une note" */
-        button[key*="add_note_partnership"] {
-            background: #FF7900 !important;
-            border: none !important;
-            color: #FFFFFF !important;
-            font-weight: 500 !important;
-            font-size: 14px !important;
-            border-radius: 4px !important;
-            padding: 10px 20px !important;
-            transition: all 0.2s ease !important;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.12) !important;
-            letter-spacing: 0.02em !important;
-        }
-        
-        button[key*="add_note_partnership"]:hover {
-            background: #E66A00 !important;
-            box-shadow: 0 2px 6px rgba(0, 0, 0, 0.15) !important;
-            transform: translateY(-1px) !important;
-        }
-        
-        /* Bouton Enregistrer */
-        button[key*="save_partnership_note"] {
-            background: #FF7900 !important;
-            border: none !important;
-            color: #FFFFFF !important;
-            font-weight: 500 !important;
-            font-size: 14px !important;
-            border-radius: 4px !important;
-            padding: 8px 16px !important;
-            transition: all 0.2s ease !important;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.12) !important;
-        }
-        
-        button[key*="save_partnership_note"]:hover {
-            background: #E66A00 !important;
-            box-shadow: 0 2px 6px rgba(0, 0, 0, 0.15) !important;
-        }
-        
-        /* Bouton Annuler */
-        button[key*="cancel_partnership_note"] {
-            background: #FFFFFF !important;
-            border: 1px solid #DEE2E6 !important;
-            color: #6C757D !important;
-            font-weight: 500 !important;
-            font-size: 14px !important;
-            border-radius: 4px !important;
-            padding: 8px 16px !important;
-            transition: all 0.2s ease !important;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05) !important;
-        }
-        
-        button[key*="cancel_partnership_note"]:hover {
-            background: #F8F9FA !important;
-            border-color: #ADB5BD !important;
-            color: #495057 !important;
-        }
-        
-        /* Bouton Modifier */
-        button[key*="edit_partnership_note"] {
-            background: #FFFFFF !important;
-            border: 1px solid #FF7900 !important;
-            color: #FF7900 !important;
-            font-weight: 500 !important;
-            font-size: 13px !important;
-            border-radius: 4px !important;
-            padding: 6px 12px !important;
-            transition: all 0.2s ease !important;
-        }
-        
-        button[key*="edit_partnership_note"]:hover {
-            background: #FF7900 !important;
-            color: #FFFFFF !important;
-        }
-        
-        /* Bouton Supprimer */
-        button[key*="delete_partnership_note"] {
-            background: #FFFFFF !important;
-            border: 1px solid #DC3545 !important;
-            color: #DC3545 !important;
-            font-weight: 500 !important;
-            font-size: 13px !important;
-            border-radius: 4px !important;
-            padding: 6px 12px !important;
-            transition: all 0.2s ease !important;
-        }
-        
-        button[key*="delete_partnership_note"]:hover {
-            background: #DC3545 !important;
-            color: #FFFFFF !important;
-        }
-        
-        /* Champ de texte */
-        .stTextArea textarea {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif !important;
-            font-size: 14px !important;
-            line-height: 1.5 !important;
-            border: 1px solid #DEE2E6 !important;
-            border-radius: 4px !important;
-            padding: 12px !important;
-            background: #FFFFFF !important;
-            color: #2C3E50 !important;
-            transition: border-color 0.2s ease !important;
-            resize: vertical !important;
-        }
-        
-        .stTextArea textarea:focus {
-            border-color: #FF7900 !important;
-            box-shadow: 0 0 0 2px rgba(255, 121, 0, 0.1) !important;
-            outline: none !important;
-        }
-        
-        .stTextArea textarea::placeholder {
-            color: #6C757D !important;
-            font-style: italic !important;
-        }
-        
-        /* Messages d'alerte */
-        .stSuccess > div {
-            background: linear-gradient(90deg, #D4EDDA, #C3E6CB) !important;
-            border-left: 4px solid #28A745 !important;
-            color: #155724 !important;
-            border-radius: 4px !important;
-            padding: 12px 16px !important;
-            font-weight: 500 !important;
-        }
-        
-        .stWarning > div {
-            background: linear-gradient(90deg, #FFF3CD, #FFEAA7) !important;
-            border-left: 4px solid #FFC107 !important;
-            color: #856404 !important;
-            border-radius: 4px !important;
-            padding: 12px 16px !important;
-            font-weight: 500 !important;
-        }
-        
-        /* Section description avec hauteur automatique */
-        .description-section {
-            background-color: #FFFFFF !important;
-            border: 1px solid #E6E6E6 !important;
-            border-radius: 8px !important;
-            padding: 20px !important;
-            margin-bottom: 20px !important;
-            color: #000000 !important;
-            position: relative !important;
-            min-height: 200px !important;
-            height: auto !important;
-            box-sizing: border-box !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    # Créer un identifiant unique pour éviter les conflits de clés.
+    # Clé déterministe : hash() est randomisé par processus, ce qui changerait
+    # les clés des widgets (et perdrait leur état) à chaque redémarrage.
+    unique_id = str(start_date or "default").replace(" ", "_")
 
-    # ✅ Utiliser la note sauvegardée ou description vide par défaut
-    current_description = st.session_state.get("partnership_saved_note") or partnership_data.get("description", "")
-    
-    # ✅ Gestion des points vides
-    points_html = ""
-    if partnership_data.get("points") and partnership_data["points"]:
-        for point in partnership_data["points"]:
-            if point:  # Vérifier que le point n'est pas vide
-                points_html += f'<li style="margin-bottom: 10px;">{point}</li>'
+    # ✅ Utiliser la note sauvegardée ou description vide par défaut.
+    # La note vient de l'utilisateur : échappée ici avant interpolation HTML
+    # (les données backend arrivent déjà échappées par le loader).
+    saved_note = st.session_state.get("partnership_saved_note")
+    current_description = html.escape(saved_note) if saved_note else partnership_data.get("description", "")
 
-    st.markdown(
+    # ✅ Gestion des points vides — une seule allocation via join
+    points_html = "".join(
+        f'<li style="margin-bottom: 10px;">{point}</li>'
+        for point in partnership_data.get("points") or ()
+        if point  # Vérifier que le point n'est pas vide
+    )
+
+    # Bloc description + séparateur en un seul appel : un seul ForwardMsg
+    # et un seul parse côté navigateur. Le CSS vient de static/partnership.css,
+    # servi et mis en cache par le navigateur (cf. app.load_css).
+    st.html(
         f"""
     <div class="description-section">
         <div class="date-box">
             <div class="date-label">Date de début du<br>partenariat :</div>
-            <div class="date-value">{partnership_data.get("start_date", "N/A")}</div>
+            <div class="date-value">{start_date or "N/A"}</div>
         </div>
         <h3 class="section-title">Description du partenariat</h3>
         <div class="content-with-date">
@@ -194,42 +80,33 @@ def render_partnership_description(partnership_data: dict, company_sheet=None):
                 {current_description if current_description else "Aucune description de partenariat disponible."}
             </p>
             {f'<ul style="color: #000000 !important; margin-left: 20px; padding-left: 0;">{points_html}</ul>' if points_html else ''}</div></div>
-    """,
-        unsafe_allow_html=True,
-    )
-    
-    # Section boutons d'action avec style professionnel
-    st.markdown(
-        """
-        <div style="
-            border-top: 1px solid #E6E6E6;
-            margin-top: 20px;
-            padding-top: 20px;
-        "></div>
-        """,
-        unsafe_allow_html=True,
+    <div style="
+        border-top: 1px solid #E6E6E6;
+        margin-top: 20px;
+        padding-top: 20px;
+    "></div>
+    """
     )
-    
-    # Conteneur pour le bouton principal avec style professionnel Orange
-    button_container = st.container()
-    with button_container:
-        col1, col2, col3 = st.columns([1, 1, 1])
-        
-        with col2:
-            # Bouton principal avec clé unique
-            add_note = st.button(
-                "Ajouter une note",
-                key=f"add_note_partnership_{unique_id}",
-                help="Ajouter un commentaire ou une observation concernant ce partenariat",
-                use_container_width=True
-            )
-            
-            if add_note:
-                st.session_state.show_partnership_note_field = True
+
+    # Bouton principal centré — colonnes directes, sans st.container
+    # intermédiaire : un nœud de moins dans l'arbre d'éléments par rerun.
+    col1, col2, col3 = st.columns(_CENTER_COLS)
+
+    with col2:
+        # Bouton principal avec clé unique
+        add_note = st.button(
+            "Ajouter une note",
+            key=f"add_note_partnership_{unique_id}",
+            help="Ajouter un commentaire ou une observation concernant ce partenariat",
+            use_container_width=True
+        )
+
+        if add_note:
+            st.session_state.show_partnership_note_field = True
     
     # Interface de saisie de note avec design professionnel
     if st.session_state.get("show_partnership_note_field", False):
-        st.markdown(
+        st.html(
             """
             <div style="
                 background: linear-gradient(145deg, #FFFFFF, #F8F9FA);
@@ -264,8 +141,7 @@ def render_partnership_description(partnership_data: dict, company_sheet=None):
                 ">
                     Décrivez les détails du partenariat avec ce client.
                 </p></div>
-            """,
-            unsafe_allow_html=True,
+            """
         )
         
         # Champ de texte avec clé unique
@@ -275,13 +151,13 @@ def render_partnership_description(partnership_data: dict, company_sheet=None):
             height=150,
             key=f"partnership_note_content_{unique_id}",
             label_visibility="collapsed",
-            value=st.session_state.get("partnership_saved_note", "")
+            value=saved_note or ""
         )
         
         # Boutons d'action avec design professionnel
-        st.markdown("<div style='margin-top: 20px;'></div>", unsafe_allow_html=True)
+        st.html("<div style='margin-top: 20px;'></div>")
         
-        action_col1, action_col2, action_col3 = st.columns([1, 1, 2])
+        action_col1, action_col2, action_col3 = st.columns(_ACTION_COLS)
         
         with action_col1:
             save_note = st.button(
@@ -308,7 +184,7 @@ def render_partnership_description(partnership_data: dict, company_sheet=None):
                         st.session_state.partnership_saved_note = success
                         st.session_state.show_partnership_note_field = False
                         st.success("Description enregistrée avec succès")
-                        st.rerun()
+                        st.rerun(scope="fragment")
                     else:
                         st.error("Erreur lors de l'enregistrement")
                 else:
@@ -316,30 +192,20 @@ def render_partnership_description(partnership_data: dict, company_sheet=None):
                     st.session_state.partnership_saved_note = note_content.strip()
                     st.session_state.show_partnership_note_field = False
                     st.success("Description enregistrée localement")
-                    st.rerun()
+                    st.rerun(scope="fragment")
             else:
                 st.warning("Veuillez saisir une description avant d'enregistrer")
         
         if cancel_note:
             st.session_state.show_partnership_note_field = False
-            st.rerun()
+            st.rerun(scope="fragment")
     
     # Affichage séparé de la note avec troncature (pour montrer au client ce qu'il a écrit)
-    if st.session_state.get("partnership_saved_note"):
-        # Fonction pour tronquer le texte selon vos spécifications
-        def truncate_note(text, start_words=5, end_words=2):
-            words = text.split()
-            if len(words) <= start_words + end_words:
-                return text
-            
-            start_part = " ".join(words[:start_words])
-            end_part = " ".join(words[-end_words:])
-            return f"{start_part} ... {end_part}"
-        
-        truncated_note = truncate_note(st.session_state.partnership_saved_note)
+    if saved_note:
+        truncated_note = html.escape(truncate_note(saved_note))
         
         # Encart séparé pour montrer ce que le client a écrit
-        st.markdown(
+        st.html(
             f"""
             <div style="
                 background: linear-gradient(145deg, #F8FDF8, #FFFFFF);
@@ -377,12 +243,11 @@ def render_partnership_description(partnership_data: dict, company_sheet=None):
                             line-height: 1.6;
                             font-size: 14px;
                         ">{truncated_note}</span></div></div></div>
-            """,
-            unsafe_allow_html=True,
+            """
         )
         
         # Actions sur la note avec design minimaliste
-        note_actions_col1, note_actions_col2, note_actions_col3 = st.columns([1, 1, 2])
+        note_actions_col1, note_actions_col2, note_actions_col3 = st.columns(_ACTION_COLS)
         
         with note_actions_col1:
             edit_note = st.button(
@@ -401,13 +266,13 @@ def render_partnership_description(partnership_data: dict, company_sheet=None):
             )
         
         if edit_note:
-            st.session_state.partnership_note_content = st.session_state.partnership_saved_note
+            st.session_state.partnership_note_content = saved_note
             st.session_state.show_partnership_note_field = True
-            st.rerun()
+            st.rerun(scope="fragment")
         
         if reset_note:
             del st.session_state.partnership_saved_note
             if "partnership_note_content" in st.session_state:
                 del st.session_state.partnership_note_content
             st.success("Description réinitialisée")
-            st.rerun()
+            st.rerun(scope="fragment")
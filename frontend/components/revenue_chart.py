@@ -1,29 +1,105 @@
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
+# Dégradé Orange appliqué aux traces, dans l'ordre d'apparition des produits.
+_PALETTE = ["#FF7900", "#FF9933", "#FFAB4D", "#FFBD66", "#FFCF80", "#FFE199"]
 
-def render_revenue_chart(revenue_data: pd.DataFrame):
-    """Render the revenue chart with interactive filters.
+# Mise en forme construite une fois à l'import : seule la partie dépendante
+# des filtres (titres d'axes, légende) est passée à l'appel. Les réglages
+# d'axes des anciens update_xaxes/update_yaxes sont fusionnés ici — deux
+# passes de validation Plotly en moins par figure.
+_BASE_LAYOUT = dict(
+    # px.bar empilait les traces (barmode "relative") ; go.Figure groupe
+    # par défaut, on conserve donc l'empilement explicitement.
+    barmode="relative",
+    plot_bgcolor="white",
+    paper_bgcolor="white",
+    font=dict(color="#000000", family="Arial, sans-serif"),
+    xaxis=dict(
+        showgrid=False,
+        showline=True,
+        linecolor="#000000",
+        title_font=dict(color="#000000", size=10),
+        tickfont=dict(color="#000000", size=9, family="Arial, sans-serif"),
+    ),
+    yaxis=dict(
+        showgrid=True,
+        gridcolor="#E6E6E6",
+        showline=False,
+        tickformat=".2s",
+        title_font=dict(color="#000000", size=10),
+        tickfont=dict(color="#000000", size=9, family="Arial, sans-serif"),
+    ),
+    height=400,
+    margin=dict(l=40, r=40, t=40, b=40),
+)
 
-    Args:
-        revenue_data: DataFrame containing revenue data by product and date
+_LEGEND_LAYOUT = dict(
+    orientation="h",
+    yanchor="bottom",
+    y=1.02,
+    xanchor="right",
+    x=1,
+    font=dict(color="#000000", size=9, family="Arial, sans-serif"),
+    title=dict(text="Produit", font=dict(color="#000000", size=10, family="Arial, sans-serif")),
+)
+
+
+@st.cache_data(show_spinner=False)
+def _prepare_revenue(revenue_data: pd.DataFrame) -> pd.DataFrame:
+    """Prétraitement une fois par dataset, mémoïsé.
+
+    `DateD` (datetime64[D]) remplace les appels `.dt.date` du filtre : la
+    comparaison reste vectorisée en int64 au lieu d'allouer un ndarray
+    d'objets `datetime.date` à chaque rerun.
     """
-    if revenue_data is None or revenue_data.empty:
-        st.error("Données de revenus non disponibles")
-        return
+    df = revenue_data.copy()
+    df["DateD"] = df["Date"].values.astype("datetime64[D]")
+    # Colonne à faible cardinalité : en catégorie, .isin/.unique/groupby
+    # comparent des codes entiers au lieu de hacher des chaînes par ligne.
+    df["Produit"] = df["Produit"].astype("category")
+    # float32 suffit largement pour des montants affichés en ".2s" : les
+    # sommes et la sérialisation vers Plotly traitent moitié moins d'octets.
+    df["Revenu"] = df["Revenu"].astype("float32")
+    # Clés de période recalculées en vectoriel : les groupby comparent des
+    # ordinaux int64 de Period au lieu des chaînes strftime produites ligne
+    # à ligne par le générateur de données. Converties en str après
+    # agrégation seulement (Plotly ne sérialise pas les Periods).
+    df["Mois"] = df["Date"].dt.to_period("M")
+    df["Semaine"] = df["Date"].dt.to_period("W")
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _revenue_meta(revenue_data: pd.DataFrame):
+    """Valeurs de filtres (produits, dates) calculées une fois par dataset.
+
+    Ces deux scans O(N) tournaient à chaque rerun alors que le DataFrame est
+    immuable pendant la session ; st.cache_data les mémoïse sur son empreinte.
+    """
+    produits = list(revenue_data["Produit"].unique())
+    # np.unique sur la colonne datetime64 trie en int64 ; le passage par
+    # [D] + .tolist() redonne des datetime.date pour le select_slider.
+    dates = np.unique(revenue_data["DateD"].values).astype("datetime64[D]").tolist()
+    return produits, dates
+
 
-    st.markdown(
-        """
+# Granularité -> colonne d'abscisse de l'agrégat.
+_X_COLS = {"Mensuel": "Mois", "Hebdomadaire": "Semaine", "Journalier": "Date"}
+
+# Blocs HTML statiques construits une fois à l'import : identiques à chaque
+# rerun, inutile de re-concaténer les littéraux dans le corps du rendu.
+# Ils restent sur st.markdown : les ouvertures/fermetures de conteneurs sont
+# des fragments non équilibrés que st.html refuserait de recoller.
+_TITLE_HTML = """
     <div class="white-section" style="text-align: left; margin-bottom: 15px;">
         <h3 class="section-title">Revenus Générés</h3>
     </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
 
-    st.markdown(
-        """<div
+_FILTER_BOX_OPEN = """<div
         style="
             background-color: #FFFFFF;
             padding: 10px;
@@ -31,15 +107,10 @@ def render_revenue_chart(revenue_data: pd.DataFrame):
             margin-bottom: 10px;
             border: 1px solid #E6E6E6;
         "
-    >""",
-        unsafe_allow_html=True,
-    )
-
-    label_col1, label_col2, label_col3 = st.columns(3)
+    >"""
 
-    with label_col1:
-        st.markdown(
-            """<div style="text-align: center; margin-bottom: 5px;">
+# Les trois libellés de filtre ne diffèrent que par leur texte.
+_FILTER_LABEL = """<div style="text-align: center; margin-bottom: 5px;">
         <span
             style="
                 color: #FF7900;
@@ -48,50 +119,180 @@ def render_revenue_chart(revenue_data: pd.DataFrame):
                 text-transform: uppercase;
                 letter-spacing: 1px;
             "
-            >Granularité Temporelle</span
+            >{}</span
         >
-    </div>""",
-            unsafe_allow_html=True,
+    </div>""".format
+
+_LABEL_GRANULARITE = _FILTER_LABEL("Granularité Temporelle")
+_LABEL_PRODUIT = _FILTER_LABEL("Segmentation Produit")
+_LABEL_INTERVAL = _FILTER_LABEL("Interval Temporelle")
+
+_SPACER_28 = '<div style="height: 28px;"></div>'
+
+_CHART_BOX_OPEN = """<div
+        style="
+            background-color: #FFFFFF;
+            padding: 15px;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        "
+    >"""
+
+_DIV_CLOSE = "</div>"
+
+
+def _stringify_periods(df_agg: pd.DataFrame, x_col: str) -> pd.DataFrame:
+    """Convertit l'abscisse Period en str après agrégation.
+
+    La conversion ne porte que sur les quelques lignes agrégées, pas sur le
+    dataset complet, et n'est appliquée qu'aux colonnes Mois/Semaine : Plotly
+    sérialise les datetimes de `Date` nativement.
+    """
+    if x_col != "Date":
+        df_agg[x_col] = df_agg[x_col].astype(str)
+    return df_agg
+
+
+@st.cache_data(show_spinner=False)
+def _full_range_aggregates(revenue_data: pd.DataFrame):
+    """Les trois agrégats plein-périmètre, calculés une fois par dataset.
+
+    La vue par défaut (tous produits, fenêtre complète) est de loin la plus
+    fréquente : la servir depuis ces tables évite tout masque/groupby, quel
+    que soit l'ordre dans lequel l'utilisateur bascule de granularité.
+    """
+    return {
+        periode: _stringify_periods(
+            revenue_data.groupby([x_col, "Produit"], sort=False, observed=True)["Revenu"]
+            .sum()
+            .reset_index(),
+            x_col,
         )
+        for periode, x_col in _X_COLS.items()
+    }
 
-    with label_col2:
-        st.markdown(
-            """<div style="text-align: center; margin-bottom: 5px;">
-        <span
-            style="
-                color: #FF7900;
-                font-size: 10px;
-                font-weight: bold;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            "
-            >Segmentation Produit</span
-        >
-    </div>""",
-            unsafe_allow_html=True,
+
+@st.cache_data(show_spinner=False)
+def _aggregate_revenue(revenue_data: pd.DataFrame, periode: str, produits_key: tuple, fenetre: tuple):
+    """Filtre + agrégation, mémoïsés par (dataset, période, produits, fenêtre).
+
+    Chaque rerun avec des filtres inchangés (cas le plus fréquent : une
+    interaction ailleurs sur la page) retombe sur l'agrégat en cache au lieu
+    de refaire masque et groupby.
+    """
+    # Un seul masque combiné appliqué en une passe : ni copie intégrale du
+    # DataFrame d'entrée, ni matérialisation intermédiaire par filtre.
+    mask = np.ones(len(revenue_data), dtype=bool)
+
+    if produits_key:
+        mask &= revenue_data["Produit"].isin(produits_key).values
+
+    fenetre_debut, fenetre_fin = fenetre
+    if fenetre_debut and fenetre_fin:
+        dated = revenue_data["DateD"].values
+        mask &= dated >= np.datetime64(fenetre_debut)
+        mask &= dated <= np.datetime64(fenetre_fin)
+
+    df_filtered = revenue_data.loc[mask]
+    x_col = _X_COLS.get(periode, "Date")
+
+    # observed=True : sans lui, les catégories filtrées réapparaîtraient en
+    # lignes à zéro dans l'agrégat.
+    df_agg = df_filtered.groupby([x_col, "Produit"], sort=False, observed=True)["Revenu"].sum().reset_index()
+    return _stringify_periods(df_agg, x_col), x_col
+
+
+@st.cache_data(show_spinner=False)
+def _build_fig(df_agg: pd.DataFrame, x_col: str, n_products: int):
+    """Figure Plotly mémoïsée par (agrégat, abscisse, nombre de produits).
+
+    Construire la figure (traces + mise en forme) coûte plus cher que
+    l'agrégation elle-même ; tant que les filtres ne changent pas, les
+    reruns resservent la figure en cache.
+
+    go.Bar direct plutôt que px.bar : pas d'inférence de schéma ni de
+    construction d'expression intermédiaire, juste une trace par produit
+    sur des tranches déjà agrégées.
+    """
+    fig = go.Figure()
+
+    if n_products > 1:
+        for i, (produit, part) in enumerate(
+            df_agg.groupby("Produit", sort=False, observed=True)
+        ):
+            fig.add_trace(
+                go.Bar(
+                    x=part[x_col],
+                    y=part["Revenu"],
+                    name=str(produit),
+                    marker_color=_PALETTE[i % len(_PALETTE)],
+                )
+            )
+    else:
+        fig.add_trace(go.Bar(x=df_agg[x_col], y=df_agg["Revenu"], marker_color=_PALETTE[0]))
+
+    multi = n_products > 1
+    fig.update_layout(
+        **_BASE_LAYOUT,
+        xaxis_title=x_col,
+        yaxis_title="Revenu",
+        showlegend=multi,
+        legend=_LEGEND_LAYOUT if multi else {},
+    )
+
+    if n_products == 1:
+        fig.update_traces(
+            texttemplate="%{y:.2s}",
+            textposition="outside",
+            textfont=dict(color="#000000", size=8, family="Arial, sans-serif"),
+        )
+    else:
+        fig.update_traces(
+            texttemplate="%{y:.2s}",
+            textposition="inside",
+            textfont=dict(color="#000000", size=8, family="Arial, sans-serif"),
         )
 
+    return fig
+
+
+@st.fragment
+def render_revenue_chart(revenue_data: pd.DataFrame):
+    """Render the revenue chart with interactive filters.
+
+    Le fragment limite la portée des filtres (granularité, produits, fenêtre)
+    à cette section : changer un filtre ne rejoue que le graphique, pas la
+    page entière.
+
+    Args:
+        revenue_data: DataFrame containing revenue data by product and date
+    """
+    if revenue_data is None or revenue_data.empty:
+        st.error("Données de revenus non disponibles")
+        return
+
+    st.markdown(_TITLE_HTML, unsafe_allow_html=True)
+
+    st.markdown(_FILTER_BOX_OPEN, unsafe_allow_html=True)
+
+    label_col1, label_col2, label_col3 = st.columns(3)
+
+    with label_col1:
+        st.markdown(_LABEL_GRANULARITE, unsafe_allow_html=True)
+
+    with label_col2:
+        st.markdown(_LABEL_PRODUIT, unsafe_allow_html=True)
+
     with label_col3:
-        st.markdown(
-            """<div style="text-align: center; margin-bottom: 5px;">
-        <span
-            style="
-                color: #FF7900;
-                font-size: 10px;
-                font-weight: bold;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            "
-            >Interval Temporelle</span
-        >
-    </div>""",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_LABEL_INTERVAL, unsafe_allow_html=True)
+
+    revenue_data = _prepare_revenue(revenue_data)
+    produits_disponibles, dates_disponibles = _revenue_meta(revenue_data)
 
     filter_col1, filter_col2, filter_col3 = st.columns(3)
 
     with filter_col1:
-        st.markdown('<div style="height: 28px;"></div>', unsafe_allow_html=True)
+        st.markdown(_SPACER_28, unsafe_allow_html=True)
         periode = st.selectbox(
             "Période",
             options=["Mensuel", "Hebdomadaire", "Journalier"],
@@ -101,7 +302,6 @@ def render_revenue_chart(revenue_data: pd.DataFrame):
         )
 
     with filter_col2:
-        produits_disponibles = list(revenue_data["Produit"].unique())
         produits_options = ["Tout", *produits_disponibles]
 
         produits_selectionnes = st.multiselect(
@@ -117,7 +317,6 @@ def render_revenue_chart(revenue_data: pd.DataFrame):
             produits_finaux = [p for p in produits_selectionnes if p != "Tout"]
 
     with filter_col3:
-        dates_disponibles = sorted(list(revenue_data["Date"].dt.date.unique()))
         if len(dates_disponibles) > 1:
             fenetre_debut, fenetre_fin = st.select_slider(
                 "Période",
@@ -129,119 +328,30 @@ def render_revenue_chart(revenue_data: pd.DataFrame):
         else:
             fenetre_debut = fenetre_fin = dates_disponibles[0] if dates_disponibles else None
 
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    df_filtered = revenue_data.copy()
-
-    if produits_finaux:
-        df_filtered = df_filtered[df_filtered["Produit"].isin(produits_finaux)]
+    st.markdown(_DIV_CLOSE, unsafe_allow_html=True)
 
-    if fenetre_debut and fenetre_fin:
-        df_filtered = df_filtered[
-            (df_filtered["Date"].dt.date >= fenetre_debut)
-            & (df_filtered["Date"].dt.date <= fenetre_fin)
-        ]
-
-    if periode == "Mensuel":
-        df_agg = df_filtered.groupby(["Mois", "Produit"])["Revenu"].sum().reset_index()
-        x_col = "Mois"
-    elif periode == "Hebdomadaire":
-        df_agg = df_filtered.groupby(["Semaine", "Produit"])["Revenu"].sum().reset_index()
-        x_col = "Semaine"
-    else:
-        df_agg = df_filtered.groupby(["Date", "Produit"])["Revenu"].sum().reset_index()
-        x_col = "Date"
-
-    st.markdown(
-        """<div
-        style="
-            background-color: #FFFFFF;
-            padding: 15px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        "
-    >""",
-        unsafe_allow_html=True,
+    # Vue par défaut (tous produits, fenêtre complète) : table pré-agrégée.
+    # Le filtrage fin — y compris les périodes partielles — passe par le
+    # chemin masque + groupby mémoïsé.
+    full_window = (
+        not dates_disponibles
+        or (fenetre_debut == dates_disponibles[0] and fenetre_fin == dates_disponibles[-1])
     )
-
-    if len(produits_finaux) > 1:
-        fig = px.bar(
-            df_agg,
-            x=x_col,
-            y="Revenu",
-            color="Produit",
-            color_discrete_sequence=[
-                "#FF7900",
-                "#FF9933",
-                "#FFAB4D",
-                "#FFBD66",
-                "#FFCF80",
-                "#FFE199",
-            ],
-        )
+    if full_window and set(produits_finaux) == set(produits_disponibles):
+        df_agg = _full_range_aggregates(revenue_data)[periode]
+        x_col = _X_COLS.get(periode, "Date")
     else:
-        fig = px.bar(df_agg, x=x_col, y="Revenu", color_discrete_sequence=["#FF7900"])
-
-    fig.update_layout(
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        font=dict(color="#000000", family="Arial, sans-serif"),
-        showlegend=True if len(produits_finaux) > 1 else False,
-        xaxis=dict(
-            showgrid=False,
-            showline=True,
-            linecolor="#E6E6E6",
-            tickfont=dict(color="#000000", size=9, family="Arial, sans-serif"),
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor="#E6E6E6",
-            showline=False,
-            tickfont=dict(color="#000000", size=9, family="Arial, sans-serif"),
-            tickformat=".2s",
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            font=dict(color="#000000", size=9, family="Arial, sans-serif"),
-            title=dict(
-                text="Produit", font=dict(color="#000000", size=10, family="Arial, sans-serif")
-            ),
+        df_agg, x_col = _aggregate_revenue(
+            revenue_data,
+            periode,
+            tuple(sorted(produits_finaux)),
+            (fenetre_debut, fenetre_fin),
         )
-        if len(produits_finaux) > 1
-        else {},
-        height=400,
-        margin=dict(l=40, r=40, t=40, b=40),
-    )
 
-    fig.update_xaxes(
-        title_font=dict(color="#000000", size=10),
-        tickfont=dict(color="#000000", size=9),
-        linecolor="#000000",
-    )
+    st.markdown(_CHART_BOX_OPEN, unsafe_allow_html=True)
 
-    fig.update_yaxes(
-        title_font=dict(color="#000000", size=10),
-        tickfont=dict(color="#000000", size=9),
-        gridcolor="#E6E6E6",
-    )
-
-    if len(produits_finaux) == 1:
-        fig.update_traces(
-            texttemplate="%{y:.2s}",
-            textposition="outside",
-            textfont=dict(color="#000000", size=8, family="Arial, sans-serif"),
-        )
-    else:
-        fig.update_traces(
-            texttemplate="%{y:.2s}",
-            textposition="inside",
-            textfont=dict(color="#000000", size=8, family="Arial, sans-serif"),
-        )
+    fig = _build_fig(df_agg, x_col, len(produits_finaux))
 
     st.plotly_chart(fig, use_container_width=True)
 
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(_DIV_CLOSE, unsafe_allow_html=True)
@@ -2,8 +2,33 @@ import streamlit as st
 from services.api_client import get_api_client
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _health_check() -> bool:
+    """Ping backend mis en cache 30s, même politique que app._cached_health_check.
+
+    Évite un aller-retour HTTP synchrone par frappe clavier.
+    """
+    return get_api_client().health_check()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _autocomplete(query: str, country: str):
+    """Autocomplétion mise en cache 30s.
+
+    Retaper ou corriger un préfixe déjà interrogé ressert le résultat en
+    cache au lieu de refaire l'appel HTTP.
+    """
+    return get_api_client().autocomplete_clients(query, country)
+
+
+@st.fragment
 def render_search_bar():
-    """Render the client search bar interface with real-time autocomplete using only autocomplete route."""
+    """Render the client search bar interface with real-time autocomplete using only autocomplete route.
+
+    Le fragment limite la frappe et l'autocomplétion à cette section ; la
+    sélection d'un client passe par st.rerun() (portée "app" par défaut),
+    qui rejoue bien toute la page pour charger la fiche.
+    """
     # Initialize API client
     api_client = get_api_client()
 
@@ -57,7 +82,7 @@ def render_search_bar():
             st.session_state.show_suggestions = False
             st.session_state.client_selected = False
 
-            if api_client.health_check():
+            if _health_check():
                 # CORRECTION: Logique de recherche améliorée
                 search_results = []
                 search_query_clean = search_query.strip()
@@ -86,9 +111,9 @@ def render_search_bar():
         ):
             st.session_state.last_processed_query = search_query
 
-            if api_client.health_check():
+            if _health_check():
                 # CORRECTION: Ajouter le paramètre country
-                autocomplete_results = api_client.autocomplete_clients(search_query, "BF")
+                autocomplete_results = _autocomplete(search_query, "BF")
 
                 # Transform to suggestions list
                 all_suggestions = []
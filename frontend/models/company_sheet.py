@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import numpy as np
@@ -64,17 +65,27 @@ class CompanySheet:
                 self.identity_data = self._prepare_identity_data(identity_response)
                 print(f"DEBUG: Initial identity_data: {self.identity_data}")
 
-                self._load_excel_contact_data(api_client)
-                self._load_excel_receivables_data(api_client)
-                self._load_excel_complaints_data(api_client)
-                self._load_excel_services_data(api_client)
-
+                # These loads hit independent backend endpoints and write
+                # disjoint attributes: run them in parallel so the sheet waits
+                # for the slowest call instead of the sum of all of them. Each
+                # helper handles its own errors (mock fallback).
+                loaders = [
+                    self._load_excel_contact_data,
+                    self._load_excel_receivables_data,
+                    self._load_excel_complaints_data,
+                    self._load_excel_services_data,
+                ]
                 if fetch_linkedin:
                     print("DEBUG: Attempting LinkedIn enrichment...")
-                    self._try_linkedin_enrichment(api_client)
+                    loaders.append(self._try_linkedin_enrichment)
                 else:
                     print("DEBUG: LinkedIn enrichment disabled")
 
+                with ThreadPoolExecutor(max_workers=len(loaders)) as pool:
+                    futures = [pool.submit(loader, api_client) for loader in loaders]
+                    for future in futures:
+                        future.result()
+
                 if not hasattr(self, "partnership_data") or self.partnership_data is None:
                     self._load_default_partnership_data(identity_response)
                 if not hasattr(self, "news_data") or self.news_data is None:
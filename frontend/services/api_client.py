@@ -1,5 +1,6 @@
 """API client for communicating with the B2B Meeting Assistant backend."""
 
+import threading
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -16,10 +17,22 @@ class APIClient:
             base_url: Base URL of the backend API
         """
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"Content-Type": "application/json", "Accept": "application/json"}
-        )
+        # One Session per thread: requests.Session is not documented as
+        # thread-safe (cookie jar and connection pool mutation), and
+        # CompanySheet fans its loaders out over a ThreadPoolExecutor.
+        self._thread_local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the calling thread's Session, creating it on first use."""
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(
+                {"Content-Type": "application/json", "Accept": "application/json"}
+            )
+            self._thread_local.session = session
+        return session
 
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response and error checking.
@@ -48,6 +48,41 @@ def test_text_to_embedding_preserves_dtype_and_normalization(mocker: MockerFixtu
     )
 
 
+def test_texts_to_embeddings_batches_in_one_encode_call(mocker: MockerFixture) -> None:
+    """Ensure batched embedding issues a single encode call and keeps float32 output.
+
+    Args:
+        mocker: Pytest fixture that simplifies dependency patching.
+    """
+    # Replace the heavy SentenceTransformer load with a deterministic stub.
+    mock_model = MagicMock()
+    mock_model.encode.return_value = np.array(
+        [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], dtype=np.float64
+    )
+    mocker.patch(
+        "backend.services.scrapping.embedding.embedding_engine.EmbeddingEngine._load_model",
+        return_value=mock_model,
+    )
+
+    engine = EmbeddingEngine()
+
+    embeddings = engine.texts_to_embeddings(["SLA upgrade", "Fiber rollout"], batch_size=16)
+
+    # One forward pass for the whole batch, with the configured sub-batch size.
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (2, 3)
+    mock_model.encode.assert_called_once_with(
+        ["SLA upgrade", "Fiber rollout"],
+        batch_size=16,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+
+    # Blank entries must be rejected before reaching the model.
+    with pytest.raises(ValueError):
+        engine.texts_to_embeddings(["valid", "  "])
+
+
 def test_get_embedding_caches_by_configuration(mocker: MockerFixture) -> None:
     """Verify cached instances reuse models only when configuration matches.
 
@@ -76,6 +76,16 @@ class _DeterministicEmbeddingEngine:
         v = np.array([0.7, 0.7, 0.0], dtype=np.float32)
         return v / np.linalg.norm(v)
 
+    def texts_to_embeddings(self, texts, batch_size: int = 32) -> np.ndarray:
+        """Return deterministic embeddings for a batch of texts.
+
+        Mirrors the production batched API by stacking per-text vectors.
+        """
+        _ = batch_size
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([self.text_to_embedding(text) for text in texts])
+
 
 @pytest.fixture(autouse=True)
 def patch_embedding_engine(mocker: MockerFixture) -> Generator[None, None, None]:
@@ -155,6 +165,35 @@ def test_relevance_and_keyword_selection_with_threshold() -> None:
     assert ambiguous_expl["decision"] == "FILTER_OUT"
 
 
+def test_batched_relevance_matches_single_article_decisions() -> None:
+    """The batched API must agree with per-article decisions and fail safe on empties.
+
+    A cloud-leaning article is kept, an ambiguous one is filtered at the strict
+    threshold, and a whitespace-only article keeps the fail-safe default.
+    """
+    engine = _make_engine(threshold=0.75, keywords=["AI", "Cloud"])
+
+    cloud_article = _make_event(
+        title="Case study: Hybrid cloud migration",
+        text="Cost optimization and governance in Azure",
+    )
+    ambiguous_article = _make_event(
+        title="Quarterly update on IT operations",
+        text="Cross-team coordination and incident workflows",
+    )
+    empty_article = _make_event(title="   ", text="\n\t")
+
+    batch = [cloud_article, ambiguous_article, empty_article]
+    decisions = engine.is_articles_relevant(batch)
+
+    assert decisions == [
+        engine.is_article_relevant(cloud_article),
+        engine.is_article_relevant(ambiguous_article),
+        True,  # Empty text keeps the fail-safe default.
+    ]
+    assert engine.is_articles_relevant([]) == []
+
+
 def test_fail_safe_on_empty_article_text() -> None:
     """Ensure the engine fails safe (keep) when embedding raises on empty input.
 
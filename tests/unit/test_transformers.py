@@ -0,0 +1,78 @@
+"""Unit tests for pipeline-results-to-DataFrame transformation."""
+
+import json
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from backend.services.dataiku.transformers import (
+    DATAFRAME_COLUMNS,
+    pipeline_results_to_arrow,
+    pipeline_results_to_dataframe,
+)
+from backend.services.scrapping.base_plugin import Event
+
+
+class TestPipelineResultsToDataframe:
+    """Test suite for pipeline_results_to_dataframe."""
+
+    def test_empty_results_return_empty_dataframe(self):
+        """An empty results dict yields an empty frame with the full schema."""
+        df = pipeline_results_to_dataframe({})
+
+        assert df.empty
+        assert list(df.columns) == DATAFRAME_COLUMNS
+
+    def test_event_list_is_flattened_to_rows(self):
+        """Each event in a plugin's list becomes one row."""
+        events = [
+            Event(
+                source="rss",
+                source_type="sectorial news",
+                title="Title",
+                text="Body",
+                url="http://example.com/1",
+                published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            ),
+            Event(source="rss", source_type="sectorial news", text="Body 2"),
+        ]
+
+        df = pipeline_results_to_dataframe({"my rss": events})
+
+        assert len(df) == 2
+        assert df.loc[0, "title"] == "Title"
+        assert df.loc[0, "published_at"] == pd.Timestamp("2025-01-01", tz="UTC")
+        assert df.loc[1, "text"] == "Body 2"
+
+    def test_error_payload_becomes_error_row(self):
+        """A plugin error payload is recorded as a single error row."""
+        df = pipeline_results_to_dataframe({"linkedin": {"error": "boom"}})
+
+        assert len(df) == 1
+        assert df.loc[0, "source"] == "linkedin"
+        assert df.loc[0, "error"] == "boom"
+
+    def test_profile_data_is_serialized_to_json(self):
+        """Dict profile_data is stored as a JSON string."""
+        event = {"source": "linkedin", "text": "post", "profile_data": {"industry": "tech"}}
+
+        df = pipeline_results_to_dataframe({"linkedin": [event]})
+
+        assert json.loads(df.loc[0, "profile_data"]) == {"industry": "tech"}
+
+
+class TestPipelineResultsToArrow:
+    """Test suite for the optional pyarrow output path."""
+
+    def test_events_become_table_rows(self):
+        """Events land in an Arrow table with the full schema."""
+        pytest.importorskip("pyarrow")
+
+        table = pipeline_results_to_arrow(
+            {"rss": [{"source": "rss", "title": "Title", "text": "Body"}]}
+        )
+
+        assert table.num_rows == 1
+        assert table.column_names == DATAFRAME_COLUMNS
+        assert table.column("title").to_pylist() == ["Title"]